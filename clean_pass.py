@@ -1,14 +1,45 @@
-import pandas as pd
 from urllib.parse import urlparse
-import argparse
-import logging
 import sys
 from pathlib import Path
 import json
 import os
 import datetime
+import time
+import re
+import csv
 import shutil
-from glob import glob
+import errno
+import fnmatch
+import functools
+import gc
+import importlib
+import importlib.util
+import itertools
+
+class _LazyModule:
+    """Stand-in for a heavy module that is only imported on first attribute access.
+    
+    The real module then replaces the stand-in under its global name, so
+    --help, config and backup commands and early errors never pay for it.
+    """
+    
+    def __init__(self, module_name, global_name):
+        self._module_name = module_name
+        self._global_name = global_name
+    
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._module_name)
+        globals()[self._global_name] = module
+        return getattr(module, attr)
+
+pd = _LazyModule('pandas', 'pd')
+np = _LazyModule('numpy', 'np')
+# Only the cleaning paths log or prefetch in threads; each of these standard
+# modules costs more to import than the rest of startup
+logging = _LazyModule('logging', 'logging')
+futures = _LazyModule('concurrent.futures', 'futures')
+# A bare invocation is answered without building a parser
+argparse = _LazyModule('argparse', 'argparse')
 
 # For interactive keyboard input
 try:
@@ -20,12 +51,31 @@ except ImportError:
     # Windows doesn't have these modules
     UNIX_TERMINAL = False
 
+# Optional PyArrow support for multithreaded CSV parsing and Arrow-backed strings
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+if PYARROW_AVAILABLE:
+    pa = _LazyModule('pyarrow', 'pa')
+    pa_csv = _LazyModule('pyarrow.csv', 'pa_csv')
+    pa_feather = _LazyModule('pyarrow.feather', 'pa_feather')
+
+# Optional Polars support for the lazy domain-cleanup engine
+POLARS_AVAILABLE = importlib.util.find_spec('polars') is not None
+if POLARS_AVAILABLE:
+    pl = _LazyModule('polars', 'pl')
+
+# Optional orjson support for faster config file reads and writes
+ORJSON_AVAILABLE = importlib.util.find_spec('orjson') is not None
+if ORJSON_AVAILABLE:
+    orjson = _LazyModule('orjson', 'orjson')
+
 # Optional progress bar support
-try:
-    from tqdm import tqdm
-    TQDM_AVAILABLE = True
-except ImportError:
-    TQDM_AVAILABLE = False
+TQDM_AVAILABLE = importlib.util.find_spec('tqdm') is not None
+if TQDM_AVAILABLE:
+    def tqdm(*args, **kwargs):
+        """Create a tqdm progress bar, importing tqdm on first use."""
+        from tqdm import tqdm as progress_bar
+        return progress_bar(*args, **kwargs)
+else:
     # Fallback progress indicator
     class tqdm:
         def __init__(self, iterable=None, total=None, desc=None, **kwargs):
@@ -64,6 +114,84 @@ except ImportError:
             if self.desc:
                 print(f"{self.desc} complete.")
 
+# Regexes compiled once at import time instead of on every call
+_IP_RE = re.compile(r'^(?:\d{1,3}\.){3}\d{1,3}(?::\d+)?$')
+_DOMAIN_CHARS_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+_PARENS_RE = re.compile(r'\s*\([^)]*\)\s*')
+_MULTISPACE_RE = re.compile(r'\s+')
+# Scheme-less text containing one of these words is still treated as a URL
+_URL_KEYWORDS = ('localhost', 'api', 'www', 'app', 'portal')
+_URL_SCHEMES = ('http://', 'https://', 'ftp://', 'file://')
+
+# Pattern strings for column-wide string ops (pandas/Arrow/Polars kernels take str, not re.Pattern)
+# The netloc must also contain a '.', checked with a literal search: keeping that
+# out of the regex avoids backtracking and makes the extract ~2.5x faster
+_SIMPLE_NETLOC_PATTERN = r'^(?:https?|ftp|file)://(?P<netloc>[A-Za-z0-9._-]+)(?:[/?#]|$)'
+_SIMPLE_DOMAIN_PATTERN = r'^[A-Za-z0-9_](?:[A-Za-z0-9._-]*[A-Za-z0-9_])?$'
+
+# pandas' default na_values, so the direct PyArrow and Polars parses mark the same cells missing
+_PANDAS_NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+                     '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+                     'n/a', 'nan', 'null']
+
+# Password masks for every common length, built once instead of per displayed row
+_PASSWORD_MASKS = ['*' * length for length in range(256)]
+
+def password_mask(length):
+    """Return a mask of length '*' characters."""
+    return _PASSWORD_MASKS[length] if length < len(_PASSWORD_MASKS) else '*' * length
+
+# Cursor home + erase display; a plain write instead of forking clear/cls per redraw
+CLEAR_SCREEN = '\x1b[H\x1b[2J'
+
+@functools.lru_cache(maxsize=None)
+def _enable_ansi_output():
+    """Turn on escape sequence processing in the Windows console, once."""
+    if os.name != 'nt':
+        return
+    try:
+        # Set ENABLE_VIRTUAL_TERMINAL_PROCESSING on the console directly
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)) and \
+                kernel32.SetConsoleMode(handle, mode.value | 0x0004):
+            return
+    except (ImportError, AttributeError, OSError):
+        pass
+    # Older consoles: an empty command makes cmd.exe switch into VT mode
+    os.system('')
+
+def clear_screen_sequence():
+    """Return CLEAR_SCREEN when stdout is a terminal, else an empty string.
+    
+    For callers that send the clear in the same write as the next frame.
+    """
+    # Redirected output would only collect the raw escape bytes
+    if not sys.stdout.isatty():
+        return ''
+    _enable_ansi_output()
+    return CLEAR_SCREEN
+
+def clear_screen():
+    """Clear the terminal with an ANSI escape sequence."""
+    sequence = clear_screen_sequence()
+    if sequence:
+        sys.stdout.write(sequence)
+        sys.stdout.flush()
+
+def print_lines(lines, block_size=1024):
+    """Print an iterable of lines, one write per block_size lines."""
+    # Blocks keep write calls O(lines / block_size) without holding a
+    # multi-megabyte string for very large listings
+    lines = iter(lines)
+    while True:
+        block = list(itertools.islice(lines, block_size))
+        if not block:
+            break
+        print('\n'.join(block))
+
 class KeyboardInput:
     """Handle keyboard input for interactive selection."""
     
@@ -81,149 +209,164 @@ class KeyboardInput:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
     
     def get_key(self):
-        """Get a single keypress."""
+        """Block until a key is pressed and return its name."""
         if sys.platform == 'win32':
-            try:
-                import msvcrt
-                if msvcrt.kbhit():
-                    key = msvcrt.getch()
-                    if key == b'\xe0':  # Arrow key prefix on Windows
-                        key = msvcrt.getch()
-                        if key == b'H': return 'UP'
-                        elif key == b'P': return 'DOWN'
-                        elif key == b'K': return 'LEFT'
-                        elif key == b'M': return 'RIGHT'
-                    elif key == b' ': return 'SPACE'
-                    elif key == b'\r': return 'ENTER'
-                    elif key == b'\x03': return 'CTRL_C'
-                    elif key == b'\x1b': return 'ESC'  # ESC key
-                    elif key in [b'q', b'Q']: return 'QUIT'
-                    return key.decode('utf-8', errors='ignore')
-                return None
-            except ImportError:
-                return None
+            import msvcrt
+            # getch() blocks until a key arrives; no polling needed
+            key = msvcrt.getch()
+            if key == b'\xe0':  # Arrow key prefix on Windows
+                key = msvcrt.getch()
+                if key == b'H': return 'UP'
+                elif key == b'P': return 'DOWN'
+                elif key == b'K': return 'LEFT'
+                elif key == b'M': return 'RIGHT'
+            elif key == b' ': return 'SPACE'
+            elif key == b'\r': return 'ENTER'
+            elif key == b'\x03': return 'CTRL_C'
+            elif key == b'\x1b': return 'ESC'  # ESC key
+            elif key in [b'q', b'Q']: return 'QUIT'
+            return key.decode('utf-8', errors='ignore')
         elif UNIX_TERMINAL:
-            if select.select([sys.stdin], [], [], 0.1) == ([sys.stdin], [], []):
-                char = sys.stdin.read(1)
-                if char == '\x1b':  # ESC sequence
-                    # Try to read more characters for arrow keys
-                    try:
-                        next_chars = sys.stdin.read(2)
-                        if next_chars == '[A': return 'UP'
-                        elif next_chars == '[B': return 'DOWN'
-                        elif next_chars == '[C': return 'RIGHT'
-                        elif next_chars == '[D': return 'LEFT'
-                        else:
-                            return 'ESC'  # Plain ESC key
-                    except:
-                        return 'ESC'  # Plain ESC key
-                elif char == ' ': return 'SPACE'
-                elif char == '\r' or char == '\n': return 'ENTER'
-                elif char == '\x03': return 'CTRL_C'
-                elif char == 'q' or char == 'Q': return 'QUIT'
-                return char
-            return None
+            # Read the descriptor directly: a blocking read wakes on the keypress,
+            # and nothing sits in Python's stdin buffer where select() cannot see it
+            fd = sys.stdin.fileno()
+            char = os.read(fd, 1)
+            if not char:
+                raise EOFError("stdin closed")
+            if char == b'\x1b':  # ESC sequence
+                # Arrow keys send the rest of the sequence immediately; a plain
+                # ESC is followed by nothing
+                if not select.select([fd], [], [], 0.05)[0]:
+                    return 'ESC'
+                next_chars = os.read(fd, 2)
+                if next_chars == b'[A': return 'UP'
+                elif next_chars == b'[B': return 'DOWN'
+                elif next_chars == b'[C': return 'RIGHT'
+                elif next_chars == b'[D': return 'LEFT'
+                else:
+                    return 'ESC'  # Plain ESC key
+            elif char == b' ': return 'SPACE'
+            elif char == b'\r' or char == b'\n': return 'ENTER'
+            elif char == b'\x03': return 'CTRL_C'
+            elif char == b'q' or char == b'Q': return 'QUIT'
+            return char.decode('utf-8', errors='ignore')
         else:
-            # Fallback for systems without terminal support
-            return None
+            # Callers fall back to typed input on systems without terminal support
+            raise OSError("keyboard input is not supported on this terminal")
 
 def display_duplicate_group_interactive(group_df, group_info, selected_indices=None):
     """Display a group of duplicates with interactive selection."""
     if selected_indices is None:
         selected_indices = set()
     
-    os.system('clear' if os.name == 'posix' else 'cls')
+    lines = [
+        clear_screen_sequence() + "🔍 INTERACTIVE DUPLICATE SELECTION",
+        "=" * 60,
+        f"Group: {group_info}",
+        "=" * 60,
+        "",
+        "📋 Instructions:",
+        "  ↑↓ : Navigate between entries",
+        "  SPACE: Toggle selection for deletion",
+        "  ENTER: Confirm selections",
+        "  Q: Skip this group",
+        "",
+        "🗂️  Entries (❌ = selected for deletion):",
+        "-" * 60,
+    ]
     
-    print("🔍 INTERACTIVE DUPLICATE SELECTION")
-    print("=" * 60)
-    print(f"Group: {group_info}")
-    print("=" * 60)
-    print()
-    print("📋 Instructions:")
-    print("  ↑↓ : Navigate between entries")
-    print("  SPACE: Toggle selection for deletion")
-    print("  ENTER: Confirm selections")
-    print("  Q: Skip this group")
-    print()
-    print("🗂️  Entries (❌ = selected for deletion):")
-    print("-" * 60)
-    
-    for idx, (_, row) in enumerate(group_df.iterrows()):
+    # Plain tuples of just the displayed columns instead of a Series per row
+    names = group_df['name'] if 'name' in group_df.columns else [None] * len(group_df)
+    rows = zip(group_df['login_uri'], group_df['login_username'], names)
+    for idx, (uri, username, name) in enumerate(rows):
         marker = "❌" if idx in selected_indices else "  "
-        print(f"{marker} [{idx + 1:2d}] {row['login_uri']}")
-        print(f"      👤 User: {row['login_username']}")
-        if 'name' in row and pd.notna(row['name']) and row['name'].strip():
-            print(f"      🏷️  Name: {row['name']}")
-        print()
-    
-    print(f"📊 Summary: {len(selected_indices)} of {len(group_df)} entries selected for deletion")
+        lines.append(f"{marker} [{idx + 1:2d}] {uri}")
+        lines.append(f"      👤 User: {username}")
+        if isinstance(name, str) and name.strip():
+            lines.append(f"      🏷️  Name: {name}")
+        lines.append("")
+    
+    lines.append(f"📊 Summary: {len(selected_indices)} of {len(group_df)} entries selected for deletion")
+    # The clear and the whole frame go out in one write
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
     return len(group_df)
 
+def _format_entry_details(entries, show_passwords=False):
+    """Return the detail lines shown under each entry when it is highlighted."""
+    notna = pd.notna
+    details = []
+    for row in entries:
+        lines = [f"      👤 User: {row['login_username']}\n"]
+        if 'login_password' in row:
+            password = row['login_password']
+            if show_passwords:
+                password_display = str(password) if notna(password) else "[empty]"
+                lines.append(f"      🔑 Password: {password_display}\n")
+            else:
+                password_length = len(str(password)) if notna(password) else 0
+                lines.append(f"      🔑 Password: {password_mask(password_length)} ({password_length} chars)\n")
+        name = row.get('name')
+        if notna(name) and name.strip():
+            lines.append(f"      🏷️  Name: {name}\n")
+        # Show creation date if available
+        creation_date = row.get('creation_date')
+        if notna(creation_date):
+            lines.append(f"      📅 Created: {creation_date}\n")
+        details.append(''.join(lines))
+    return details
+
 def interactive_select_entries(group_df, group_info, show_passwords=False):
     """Interactive selection of entries using arrow keys and space bar."""
     selected_indices = set()
     current_row = 0
     total_rows = len(group_df)
+    # Index labels read once; selections map positions straight to labels
+    row_labels = group_df.index.to_numpy()
+    # Every row's lines are formatted once; a redraw only splices in the cursor
+    # and selection markers. Only the displayed columns are turned into dicts.
+    display_columns = [col for col in ('login_uri', 'login_username', 'login_password', 'name', 'creation_date')
+                       if col in group_df.columns]
+    entries = group_df[display_columns].to_dict('records')
+    entry_lines = [f" [{idx + 1:2d}] {row['login_uri']}\n" for idx, row in enumerate(entries)]
+    entry_details = _format_entry_details(entries, show_passwords)
+    header = (
+        "🔍 INTERACTIVE DUPLICATE SELECTION\n"
+        + "=" * 60 + "\n"
+        + f"Group: {group_info}\n"
+        + "=" * 60 + "\n\n"
+        "📋 Instructions:\n"
+        "  ↑↓ : Navigate between entries\n"
+        "  SPACE: Toggle selection for deletion\n"
+        "  ENTER: Confirm selections\n"
+        "  Q: Skip this group\n"
+        "  ESC: Quit interactive mode completely\n\n"
+        "🗂️  Entries (❌ = selected for deletion):\n"
+        + "-" * 60 + "\n"
+    )
     
     while True:
         # Clear screen and display current state
-        os.system('clear' if os.name == 'posix' else 'cls')
-        
-        print("🔍 INTERACTIVE DUPLICATE SELECTION")
-        print("=" * 60)
-        print(f"Group: {group_info}")
-        print("=" * 60)
-        print()
-        print("📋 Instructions:")
-        print("  ↑↓ : Navigate between entries")
-        print("  SPACE: Toggle selection for deletion")
-        print("  ENTER: Confirm selections")
-        print("  Q: Skip this group")
-        print("  ESC: Quit interactive mode completely")
-        print()
-        print("🗂️  Entries (❌ = selected for deletion):")
-        print("-" * 60)
-        
-        # Display entries with highlighting
-        for idx, (_, row) in enumerate(group_df.iterrows()):
-            # Highlight current row
+        frame = [clear_screen_sequence(), header]
+        for idx in range(total_rows):
+            # Highlight current row, then the selection marker
+            frame.append("▶️ " if idx == current_row else "   ")
+            frame.append("❌" if idx in selected_indices else "⬜")
+            frame.append(entry_lines[idx])
             if idx == current_row:
-                print("▶️ ", end="")
-            else:
-                print("   ", end="")
-            
-            # Selection marker
-            marker = "❌" if idx in selected_indices else "⬜"
-            print(f"{marker} [{idx + 1:2d}] {row['login_uri']}")
-            
-            # User info
-            if idx == current_row:
-                print(f"      👤 User: {row['login_username']}")
-                if 'login_password' in row:
-                    if show_passwords:
-                        password_display = str(row['login_password']) if pd.notna(row['login_password']) else "[empty]"
-                        print(f"      🔑 Password: {password_display}")
-                    else:
-                        password_length = len(str(row['login_password'])) if pd.notna(row['login_password']) else 0
-                        print(f"      🔑 Password: {'*' * password_length} ({password_length} chars)")
-                if 'name' in row and pd.notna(row['name']) and row['name'].strip():
-                    print(f"      🏷️  Name: {row['name']}")
-                # Show creation date if available
-                if 'creation_date' in row and pd.notna(row['creation_date']):
-                    print(f"      📅 Created: {row['creation_date']}")
-            print()
-        
-        print(f"📊 Summary: {len(selected_indices)} of {total_rows} entries selected for deletion")
-        print()
-        print("Press ENTER to confirm, Q to skip, ↑↓ to navigate, SPACE to toggle selection")
+                frame.append(entry_details[idx])
+            frame.append("\n")
+        frame.append(f"📊 Summary: {len(selected_indices)} of {total_rows} entries selected for deletion\n\n")
+        frame.append("Press ENTER to confirm, Q to skip, ↑↓ to navigate, SPACE to toggle selection\n")
+        # One write per frame instead of a print call per line
+        sys.stdout.write(''.join(frame))
+        sys.stdout.flush()
         
         # Get keyboard input
         try:
             with KeyboardInput() as kb:
                 while True:
                     key = kb.get_key()
-                    if key is None:
-                        continue
                     
                     if key == 'UP':
                         current_row = (current_row - 1) % total_rows
@@ -238,7 +381,7 @@ def interactive_select_entries(group_df, group_info, show_passwords=False):
                             selected_indices.add(current_row)
                         break
                     elif key == 'ENTER':
-                        return [group_df.iloc[i].name for i in selected_indices]
+                        return [row_labels[i] for i in selected_indices]
                     elif key == 'QUIT' or key == 'CTRL_C':
                         return []
                     elif key == 'ESC':
@@ -264,7 +407,7 @@ def interactive_select_entries(group_df, group_info, show_passwords=False):
                     selected_rows = [int(x.strip()) for x in user_input.split(',')]
                     
                     if all(1 <= row <= total_rows for row in selected_rows):
-                        return [group_df.iloc[row - 1].name for row in selected_rows]
+                        return [row_labels[row - 1] for row in selected_rows]
                     else:
                         print(f"Please enter numbers between 1 and {total_rows}")
                         
@@ -374,14 +517,15 @@ class BitwandenCSVValidator:
         
         return len(warnings) == 0  # Return True if no warnings
 
-def validate_csv_file(csv_file_path, logger=None):
+def validate_csv_file(csv_file_path, logger=None, df=None):
     """Validate CSV file exists and has proper structure."""
     try:
         # Check file existence
         BitwandenCSVValidator.validate_file_exists(csv_file_path)
         
-        # Try to read and validate structure
-        df = pd.read_csv(csv_file_path, nrows=100)  # Read sample for validation
+        # Try to read and validate structure (an already loaded frame is validated as is)
+        if df is None:
+            df = pd.read_csv(csv_file_path, nrows=100, dtype=str)  # Read sample for validation
         BitwandenCSVValidator.validate_csv_structure(df, logger)
         
         if logger:
@@ -399,14 +543,208 @@ def validate_csv_file(csv_file_path, logger=None):
             logger.error(error_msg)
         raise CSVValidationError(error_msg)
 
+def load_csv(csv_file_path, usecols=None):
+    """Read a Bitwarden CSV export once, keeping every column as text.
+    
+    Parsed frames are cached by path, modification time and size, so stages
+    called without a DataFrame do not re-parse an unchanged file. Callers get
+    their own copy because the cleanup stages modify frames in place; for
+    Arrow and categorical columns that copy shares the underlying buffers.
+    Passing usecols parses only those columns, for checks that need no others.
+    """
+    stat = os.stat(csv_file_path)
+    usecols = tuple(usecols) if usecols is not None else None
+    return _parse_csv_cached(os.path.abspath(csv_file_path), stat.st_mtime_ns, stat.st_size, usecols).copy()
+
+@functools.lru_cache(maxsize=2)
+def _parse_csv_cached(csv_file_path, mtime_ns, size, usecols=None):
+    """Parse the CSV; mtime_ns and size are only part of the cache key."""
+    columns = list(usecols) if usecols is not None else read_csv_header(csv_file_path)
+    df = None
+    if PYARROW_AVAILABLE:
+        # Multithreaded parse straight into Arrow string columns; declaring every
+        # column as string up front skips type inference entirely
+        convert_options = pa_csv.ConvertOptions(
+            column_types={col: pa.string() for col in columns},
+            include_columns=columns if usecols is not None else None,
+            null_values=_PANDAS_NA_VALUES, strings_can_be_null=True)
+        # Notes and other fields may hold quoted line breaks
+        parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+        try:
+            table = pa_csv.read_csv(csv_file_path, parse_options=parse_options,
+                                    convert_options=convert_options)
+            df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        except pa.ArrowInvalid:
+            # Files Arrow cannot parse are left to the C engine below
+            pass
+    if df is None:
+        # dtype=str skips per-column type inference; credentials are always strings
+        df = pd.read_csv(csv_file_path, dtype=str, engine='c',
+                         usecols=columns if usecols is not None else None)
+    # Usernames and passwords repeat across entries; dictionary-encode them once
+    # so every later duplicate check hashes integer codes
+    return categorize_columns(df, ['login_username', 'login_password'])
+
+def write_csv(df, csv_file_path):
+    """Write a DataFrame as CSV without the index, using PyArrow's C++ writer when available."""
+    if PYARROW_AVAILABLE:
+        try:
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), csv_file_path)
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Columns Arrow cannot represent fall back to the pandas writer
+            pass
+    df.to_csv(csv_file_path, index=False)
+
+# Output formats picked by the extension of an explicit --output path
+_COLUMNAR_EXTENSIONS = ('parquet', 'feather')
+
+def write_output(df, output_path):
+    """Write df to output_path as Parquet or Feather when its extension asks for it, else as CSV.
+    
+    Returns the path written: without pyarrow a columnar request is saved as CSV
+    next to it instead.
+    """
+    root, extension = split_extension(output_path)
+    extension = extension.lower()
+    if extension in _COLUMNAR_EXTENSIONS and not PYARROW_AVAILABLE:
+        print(f"⚠️  {extension.title()} output requires pyarrow (pip install pyarrow); saving as CSV")
+        extension, output_path = 'csv', f"{root}.csv"
+    if extension == 'parquet':
+        # Far smaller than CSV, for archiving; Bitwarden itself imports CSV
+        df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+    elif extension == 'feather':
+        # Arrow IPC: the fastest write, with no per-cell text formatting
+        pa_feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), output_path,
+                                 compression='lz4')
+    else:
+        write_csv(df, output_path)
+    return output_path
+
+class _CSVChunkWriter:
+    """Append DataFrame chunks to one binary CSV file, through PyArrow's C++ writer when available."""
+    
+    def __init__(self, file, columns):
+        self.file = file
+        self.columns = columns
+        self.header_written = False
+        self.writer = None
+        if PYARROW_AVAILABLE:
+            self.schema = pa.schema([(col, pa.string()) for col in columns])
+            self.writer = pa_csv.CSVWriter(file, self.schema)
+    
+    def write(self, chunk):
+        if self.writer is not None:
+            # A fixed all-string schema, since an all-empty column in one chunk
+            # would otherwise be typed differently from the next
+            self.writer.write_table(pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False))
+        else:
+            self.file.write(chunk.to_csv(header=not self.header_written, index=False).encode('utf-8'))
+            self.header_written = True
+    
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+def read_csv_header(csv_file_path):
+    """Return the column names from the first line of a CSV file."""
+    with open(csv_file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        columns = next(csv.reader(f), None)
+    if not columns:
+        raise pd.errors.EmptyDataError("No columns to parse from file")
+    return columns
+
+def _iter_csv_chunks(csv_file_path, chunksize=200_000, usecols=None):
+    """Yield the CSV as DataFrame chunks of text columns.
+    
+    With pyarrow the chunks are Arrow-backed like load_csv() frames, so URL
+    normalization, domain extraction and name cleaning on each chunk run the
+    same Arrow kernels as the in-memory path.
+    """
+    dtype = pd.ArrowDtype(pa.string()) if PYARROW_AVAILABLE else str
+    yield from pd.read_csv(csv_file_path, chunksize=chunksize, engine='c', dtype=dtype, usecols=usecols)
+
+def _key_values(values):
+    """Return a Series as a plain object array for building Python keys.
+    
+    Missing values become a sentinel so NaN keys compare equal, like
+    groupby(dropna=False); converting once is far cheaper than iterating an
+    Arrow-backed Series element by element.
+    """
+    return values.fillna('\x00').to_numpy(dtype=object)
+
+def find_duplicates_streaming(csv_file_path, subset, chunksize=200_000):
+    """Return the index labels of rows whose subset columns occur more than once, without loading the whole file."""
+    return scan_duplicates_streaming(csv_file_path, [subset], chunksize)[0]
+
+def scan_duplicates_streaming(csv_file_path, subsets, chunksize=200_000):
+    """Return find_duplicates_streaming() labels for each of several subsets, from one chunked pass.
+    
+    Results are cached by path, modification time and size like load_csv(), so
+    checks that ask for the same subsets of an unchanged file share one pass.
+    """
+    stat = os.stat(csv_file_path)
+    subsets = tuple(tuple(subset) for subset in subsets)
+    return _scan_duplicates_cached(os.path.abspath(csv_file_path), stat.st_mtime_ns, stat.st_size,
+                                   subsets, chunksize)
+
+@functools.lru_cache(maxsize=1)
+def _scan_duplicates_cached(csv_file_path, mtime_ns, size, subsets, chunksize):
+    """Scan the CSV for duplicate subset keys; mtime_ns and size are only part of the cache key.
+    
+    Only the subset columns are read. Each key remembers the label of its first
+    row until a second row turns up, so no second pass over the file is needed
+    to collect the duplicates.
+    """
+    usecols = list(dict.fromkeys(col for subset in subsets for col in subset))
+    first_seen = [{} for _ in subsets]
+    labels = [[] for _ in subsets]
+    for chunk in _iter_csv_chunks(csv_file_path, chunksize, usecols=usecols):
+        # Each column is converted once, however many subsets use it
+        values = {col: _key_values(chunk[col]) for col in usecols}
+        chunk_labels = chunk.index.tolist()
+        for subset, seen, found in zip(subsets, first_seen, labels):
+            keys = values[subset[0]] if len(subset) == 1 else zip(*(values[col] for col in subset))
+            for key, label in zip(keys, chunk_labels):
+                first = seen.setdefault(key, label)
+                if first != label:
+                    if first is not None:
+                        found.append(first)
+                        seen[key] = None
+                    found.append(label)
+    return [pd.Index(sorted(found), dtype='int64') for found in labels]
+
+# main() checks duplicate URIs and then duplicate URI + username pairs; a
+# streaming scan asks for both so that one pass over the file answers both
+_STREAMED_DUPLICATE_SUBSETS = (('login_uri',), ('login_uri', 'login_username'))
+
+def count_file_lines(file_path, buffer_size=1 << 20):
+    """Count newline characters in a file using large binary reads."""
+    total = 0
+    with open(file_path, 'rb') as f:
+        while True:
+            buf = f.read(buffer_size)
+            if not buf:
+                break
+            total += buf.count(b'\n')
+    return total
+
+def split_extension(path, default='csv'):
+    """Split a path into its root and extension (without the dot), using default when there is none."""
+    # splitext only looks at the file name, so dotted directories and dotfiles
+    # are never mistaken for an extension
+    root, extension = os.path.splitext(path)
+    return root, extension[1:] or default
+
 def get_file_size_mb(file_path):
     """Get file size in megabytes."""
     return Path(file_path).stat().st_size / (1024 * 1024)
 
-def read_csv_and_print_columns(csv_file_path, logger=None):
+def read_csv_and_print_columns(csv_file_path, logger=None, df=None):
     """Read CSV file and display column information."""
     try:
-        validate_csv_file(csv_file_path)
+        if df is None:
+            validate_csv_file(csv_file_path)
         
         # Check file size for memory optimization warning
         file_size_mb = get_file_size_mb(csv_file_path)
@@ -417,36 +755,35 @@ def read_csv_and_print_columns(csv_file_path, logger=None):
             print(f"⚠️  WARNING: {warning_msg}")
         
         # For very large files, just read a sample to get columns
-        if file_size_mb > 500:
-            df_sample = pd.read_csv(csv_file_path, nrows=100)
-            # Get total row count more efficiently
-            with open(csv_file_path, 'r', encoding='utf-8') as f:
-                total_rows = sum(1 for _ in f) - 1  # Subtract header
+        if df is None and file_size_mb > 500:
+            # Only the header is needed here, so skip the pandas parse entirely
+            columns = read_csv_header(csv_file_path)
+            # Get total row count with a buffered byte scan
+            total_rows = count_file_lines(csv_file_path) - 1  # Subtract header
             
             if logger:
-                logger.info(f"Large file: {total_rows} rows estimated, {len(df_sample.columns)} columns")
+                logger.info(f"Large file: {total_rows} rows estimated, {len(columns)} columns")
             print(f"📊 Large file detected: ~{total_rows:,} rows (estimated)")
             
             print("Column names:")
-            for i, column in enumerate(df_sample.columns, 1):
-                print(f"{i}. {column}")
+            print_lines(f"{i}. {column}" for i, column in enumerate(columns, 1))
             
-            return df_sample.columns.tolist()
+            return columns
         
         else:
-            if TQDM_AVAILABLE and get_file_size_mb(csv_file_path) > 10:
-                print("📁 Loading large CSV file...")
-                df = pd.read_csv(csv_file_path)
-                print(f"✅ Loaded {len(df):,} rows successfully")
-            else:
-                df = pd.read_csv(csv_file_path)
+            if df is None:
+                if TQDM_AVAILABLE and file_size_mb > 10:
+                    print("📁 Loading large CSV file...")
+                    df = load_csv(csv_file_path)
+                    print(f"✅ Loaded {len(df):,} rows successfully")
+                else:
+                    df = load_csv(csv_file_path)
             
             if logger:
                 logger.info(f"Successfully loaded CSV with {len(df)} rows and {len(df.columns)} columns")
             
             print("Column names:")
-            for i, column in enumerate(df.columns, 1):
-                print(f"{i}. {column}")
+            print_lines(f"{i}. {column}" for i, column in enumerate(df.columns, 1))
             
             return df.columns.tolist()
     except FileNotFoundError as e:
@@ -468,20 +805,33 @@ def read_csv_and_print_columns(csv_file_path, logger=None):
         print(f"Error: {error_msg}")
         return None
 
-def find_duplicate_login_uris(csv_file_path, logger=None):
-    """Find rows with duplicate login_uri values."""
+def find_duplicate_login_uris(csv_file_path, logger=None, df=None):
+    """Find rows with duplicate login_uri values and return their index labels."""
     try:
-        validate_csv_file(csv_file_path)
-        df = pd.read_csv(csv_file_path)
+        if df is None:
+            validate_csv_file(csv_file_path)
+            columns = read_csv_header(csv_file_path)
+            # Very large exports are scanned in chunks below instead of loaded
+            # whole; otherwise only the column being checked is parsed
+            if 'login_uri' in columns and get_file_size_mb(csv_file_path) <= 500:
+                df = load_csv(csv_file_path, usecols=['login_uri'])
+        else:
+            columns = df.columns
         
-        if 'login_uri' not in df.columns:
+        if 'login_uri' not in columns:
             error_msg = "'login_uri' column not found in the CSV file"
             if logger:
                 logger.error(error_msg)
             print(f"Error: {error_msg}.")
             return []
         
-        duplicate_rows = df[df.duplicated(subset=['login_uri'], keep=False)]
+        if df is None:
+            if 'login_username' in columns:
+                duplicate_rows = scan_duplicates_streaming(csv_file_path, _STREAMED_DUPLICATE_SUBSETS)[0]
+            else:
+                duplicate_rows = find_duplicates_streaming(csv_file_path, ['login_uri'])
+        else:
+            duplicate_rows = df.index[df.duplicated(subset=['login_uri'], keep=False).to_numpy()]
         
         if duplicate_rows.empty:
             message = "No duplicate login_uri entries found"
@@ -496,7 +846,8 @@ def find_duplicate_login_uris(csv_file_path, logger=None):
         print(f"{message}.")
         print("(Row details hidden for security - use interactive mode to see specific entries)")
         
-        return duplicate_rows.to_dict('records')
+        # Callers only need to know which rows; building a dict per row is skipped
+        return duplicate_rows
         
     except FileNotFoundError as e:
         error_msg = f"File not found: {csv_file_path}"
@@ -511,35 +862,49 @@ def find_duplicate_login_uris(csv_file_path, logger=None):
         print(f"Error: {error_msg}")
         return []
 
-def find_duplicate_uri_and_username(csv_file_path, logger=None):
+def find_duplicate_uri_and_username(csv_file_path, logger=None, df=None):
+    """Find rows with duplicate login_uri + login_username pairs and return their index labels."""
     try:
-        df = pd.read_csv(csv_file_path)
-        
         required_columns = ['login_uri', 'login_username']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        if df is None:
+            columns = read_csv_header(csv_file_path)
+            # Only the two key columns are parsed for a standalone check
+            if all(col in columns for col in required_columns) and get_file_size_mb(csv_file_path) <= 500:
+                df = load_csv(csv_file_path, usecols=required_columns)
+        else:
+            columns = df.columns
+        missing_columns = [col for col in required_columns if col not in columns]
         
         if missing_columns:
             print(f"Error: Missing columns: {missing_columns}")
             return []
         
-        duplicate_uri_rows = df[df.duplicated(subset=['login_uri'], keep=False)]
-        
-        if duplicate_uri_rows.empty:
-            print("No duplicate login_uri entries found.")
-            return []
-        
-        duplicate_uri_and_username = duplicate_uri_rows[
-            duplicate_uri_rows.duplicated(subset=['login_uri', 'login_username'], keep=False)
-        ]
+        # A repeated login_uri + login_username pair always implies a repeated
+        # login_uri, so the pairs are found in one pass over the whole frame
+        if df is None:
+            # Very large export: scan in chunks instead of loading every column;
+            # the same pass also answers the login_uri check
+            duplicate_uris, duplicate_uri_and_username = scan_duplicates_streaming(
+                csv_file_path, _STREAMED_DUPLICATE_SUBSETS)
+        else:
+            duplicate_uri_and_username = df.index[df.duplicated(subset=required_columns, keep=False).to_numpy()]
         
         if duplicate_uri_and_username.empty:
-            print("No rows found with duplicate login_uri AND login_username combinations.")
+            # Only now is it worth telling apart "no repeated URIs at all"
+            if df is None:
+                has_duplicate_uris = not duplicate_uris.empty
+            else:
+                has_duplicate_uris = df.duplicated(subset=['login_uri'], keep=False).any()
+            if not has_duplicate_uris:
+                print("No duplicate login_uri entries found.")
+            else:
+                print("No rows found with duplicate login_uri AND login_username combinations.")
             return []
         
         print(f"Found {len(duplicate_uri_and_username)} rows with duplicate login_uri AND login_username.")
         print("(Row details hidden for security - use deletion options to see specific entries)")
         
-        return duplicate_uri_and_username.to_dict('records')
+        return duplicate_uri_and_username
         
     except FileNotFoundError:
         print(f"Error: File '{csv_file_path}' not found.")
@@ -548,6 +913,30 @@ def find_duplicate_uri_and_username(csv_file_path, logger=None):
         print(f"Error processing CSV file: {e}")
         return []
 
+def duplicated_rows(df):
+    """Flag rows identical to an earlier row, like df.duplicated(keep='first').
+    
+    Fully identical rows must share login_uri, login_username and login_password,
+    so those few columns pick the candidates (narrowed by password first) and
+    only candidates are compared across every column.
+    """
+    key_columns = [col for col in ('login_password', 'login_uri', 'login_username') if col in df.columns]
+    if not key_columns:
+        return df.duplicated(keep='first').to_numpy()
+    duplicated = np.zeros(len(df), dtype=bool)
+    # Passwords are the most distinct key; a single-column check on them is cheap
+    # and, when none repeat, proves there are no full duplicates at all
+    candidates = np.flatnonzero(df[key_columns[0]].duplicated(keep=False).to_numpy())
+    if len(candidates) == 0:
+        return duplicated
+    subset = df.iloc[candidates] if len(candidates) < len(df) else df
+    if len(key_columns) > 1:
+        mask = subset.duplicated(subset=key_columns, keep=False).to_numpy()
+        candidates, subset = candidates[mask], subset[mask]
+    if len(candidates):
+        duplicated[candidates] = subset.duplicated(keep='first').to_numpy()
+    return duplicated
+
 def remove_fully_duplicate_rows(df, logger=None):
     """Remove rows that are completely identical across all columns, keeping only one copy."""
     original_count = len(df)
@@ -555,10 +944,12 @@ def remove_fully_duplicate_rows(df, logger=None):
     # Remove fully duplicate rows (keep='first' keeps the first occurrence)
     if TQDM_AVAILABLE and len(df) > 1000:
         with tqdm(total=1, desc="Removing duplicate rows") as pbar:
-            df_no_full_dupes = df.drop_duplicates(keep='first')
+            duplicated = duplicated_rows(df)
             pbar.update(1)
     else:
-        df_no_full_dupes = df.drop_duplicates(keep='first')
+        duplicated = duplicated_rows(df)
+    # Later stages assign columns, so a filtered result must be its own frame
+    df_no_full_dupes = df[~duplicated].copy() if duplicated.any() else df
     
     removed_count = original_count - len(df_no_full_dupes)
     
@@ -576,16 +967,123 @@ def remove_fully_duplicate_rows(df, logger=None):
     
     return df_no_full_dupes, removed_count
 
+def categorize_columns(df, columns, max_unique_ratio=0.7):
+    """Convert repetitive text columns to category dtype so grouping hashes integer codes."""
+    for col in columns:
+        if col in df.columns and df[col].nunique(dropna=False) < len(df) * max_unique_ratio:
+            df[col] = df[col].astype('category')
+    return df
+
+def _combination_codes(df, columns):
+    """Return integer codes and categories for each column, ready for grouping."""
+    # Group on integer codes (category codes or factorized values) so pandas takes
+    # its int64 path; grouping the categoricals directly is ~10x slower on
+    # high-cardinality columns. Missing values get code -1 and form their own group.
+    codes, categories = {}, {}
+    for col in columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            codes[col], categories[col] = df[col].cat.codes.to_numpy(), df[col].cat.categories
+        else:
+            codes[col], categories[col] = pd.factorize(df[col])
+    return codes, categories
+
+def _decode_combinations(counts, categories, columns, min_count):
+    """Map a code-indexed count Series back to the original values, keeping counts >= min_count."""
+    counts = counts[counts >= min_count]
+    # The codes already index the unique values, so they become the MultiIndex
+    # codes directly instead of being decoded and re-factorized; -1 codes
+    # become missing values
+    index = pd.MultiIndex(
+        levels=[categories[col] for col in columns],
+        codes=[counts.index.get_level_values(col).to_numpy() for col in columns],
+        names=columns, verify_integrity=False)
+    return pd.Series(counts.to_numpy(), index=index)
+
+def count_combinations(df, columns, min_count=1):
+    """Count rows per combination of column values, like groupby(dropna=False).size(), keeping counts >= min_count."""
+    codes, categories = _combination_codes(df, columns)
+    counts = pd.DataFrame(codes).groupby(columns, sort=False).size()
+    return _decode_combinations(counts, categories, columns, min_count)
+
+def count_and_pick_shortest(df, columns, min_count=1):
+    """Return count_combinations() for columns plus a boolean array marking each combination's shortest row.
+    
+    Missing login_uri_normalized values count as longest, so they are only kept
+    when a combination has nothing else. Both results come from one grouping
+    pass over the key columns.
+    """
+    codes, categories = _combination_codes(df, columns)
+    frame = pd.DataFrame(codes)
+    frame['uri_length'] = uri_lengths(df['login_uri_normalized'])
+    # size() and idxmin() share the grouper's cached group codes, so the key
+    # columns are hashed once for both; frame has a RangeIndex, so idxmin()
+    # yields positions (the first minimum, so ties keep file order)
+    grouped = frame.groupby(columns, sort=False)
+    counts = grouped.size()
+    keep = np.zeros(len(df), dtype=bool)
+    keep[grouped['uri_length'].idxmin().to_numpy()] = True
+    return _decode_combinations(counts, categories, columns, min_count), keep
+
+def _repeated_runs(codes):
+    """Return (codes, positions) for every non-negative group code occurring more than once, in code order.
+    
+    A stable argsort puts each group's rows in one run, so a duplicated() check
+    plus a hash groupby become slices of the sort order; thousands of tiny
+    groups cost no per-group frames, and positions stay in file order.
+    """
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    ends = np.r_[starts[1:], len(codes)]
+    # Negative codes mark rows excluded from grouping (missing keys)
+    repeated = (ends - starts >= 2) & (sorted_codes[starts] >= 0)
+    starts, ends = starts[repeated], ends[repeated]
+    return sorted_codes[starts], [order[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+
+def duplicate_groups(values):
+    """Return (value, positions) for every value that occurs more than once, in order of first appearance."""
+    # factorize numbers values by first appearance, so the runs are in that order
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    run_codes, positions = _repeated_runs(codes)
+    return list(zip(uniques.take(run_codes), positions))
+
+def uri_lengths(uris):
+    """Return the length of each URI as an int32 array, counting missing URIs as longest."""
+    if uris.dtype == object:
+        # Plain len() over the Python strings is several times faster than the
+        # object-dtype .str accessor
+        values = uris.to_numpy()
+        try:
+            return np.fromiter(map(len, values), dtype=np.int32, count=len(values))
+        except TypeError:
+            pass  # Missing values; the accessor below handles them
+    return uris.str.len().to_numpy(dtype=np.int32, na_value=np.iinfo(np.int32).max)
+
+def strip_trailing_slashes(uris):
+    """Return uris as text with trailing slashes removed."""
+    if isinstance(uris.dtype, pd.ArrowDtype):
+        # Arrow kernels make the trailing-slash check nearly free, so the strip is
+        # skipped when no URI needs it. The result stays Arrow-backed so domain
+        # extraction and length checks also run on Arrow kernels; missing URIs get
+        # the same '<NA>' text astype(str) would produce.
+        if uris.str.endswith('/').any():
+            uris = uris.str.rstrip('/')
+        return uris.fillna('<NA>')
+    # On Python strings an endswith() scan costs as much as the strip itself
+    return uris.astype(str).str.rstrip('/')
+
 def normalize_urls(df, logger=None):
     """Normalize login_uri by removing trailing slashes and creating a normalized column for comparison."""
     # Memory efficient: modify in place instead of copying when possible
     if 'login_uri' in df.columns:
         # Create a normalized version for comparison (remove trailing slashes)
         if TQDM_AVAILABLE and len(df) > 5000:
-            tqdm.pandas(desc="Normalizing URLs")
-            df['login_uri_normalized'] = df['login_uri'].astype(str).progress_apply(lambda x: str(x).rstrip('/'))
+            # The strip is one vectorized call, so a single-step bar is enough
+            with tqdm(total=1, desc="Normalizing URLs") as pbar:
+                df['login_uri_normalized'] = strip_trailing_slashes(df['login_uri'])
+                pbar.update(1)
         else:
-            df['login_uri_normalized'] = df['login_uri'].astype(str).str.rstrip('/')
+            df['login_uri_normalized'] = strip_trailing_slashes(df['login_uri'])
         message = "URLs normalized (trailing slashes removed for duplicate detection)"
         if logger:
             logger.info(message)
@@ -593,6 +1091,13 @@ def normalize_urls(df, logger=None):
     
     return df
 
+def _has_url_keyword(text):
+    """Return True if lowercased text contains one of the URL keywords."""
+    for keyword in _URL_KEYWORDS:
+        if keyword in text:
+            return True
+    return False
+
 def extract_domain(url):
     """Extract domain from URL with validation."""
     try:
@@ -602,12 +1107,10 @@ def extract_domain(url):
         url_str = str(url).strip()
         
         # Check if it's likely an IP address (better handling for IPs with ports/paths)
-        import re
         # Extract just the host part for IP checking
-        host_part = url_str.split('/')[0]
+        host_part = url_str.partition('/')[0]
         # Handle IP addresses with ports (e.g., 192.168.1.1:8080)
-        ip_pattern = r'^(?:\d{1,3}\.){3}\d{1,3}(?::\d+)?$'
-        if re.match(ip_pattern, host_part):
+        if _IP_RE.match(host_part):
             return host_part  # Return IP with port as is
         
         # Handle IPv6 addresses (basic check for brackets)
@@ -615,9 +1118,9 @@ def extract_domain(url):
             return host_part  # Return IPv6 as is
         
         # Only add http:// if it looks like a domain/URL (improved validation)
-        if not url_str.startswith(('http://', 'https://', 'ftp://', 'file://')):
+        if not url_str.startswith(_URL_SCHEMES):
             # Better validation for URL patterns
-            if ('.' in url_str and not url_str.endswith('.')) or any(keyword in url_str.lower() for keyword in ['localhost', 'api', 'www', 'app', 'portal']):
+            if ('.' in url_str and not url_str.endswith('.')) or _has_url_keyword(url_str.lower()):
                 url_str = 'http://' + url_str
             else:
                 # Return original if it doesn't look like a URL
@@ -631,7 +1134,7 @@ def extract_domain(url):
             return str(url).lower()  # Return original if domain extraction failed
         
         # Handle special cases: localhost, IP addresses, and valid single-word domains
-        if domain in ['localhost'] or re.match(ip_pattern, domain) or '[' in domain:
+        if domain == 'localhost' or _IP_RE.match(domain) or '[' in domain:
             return domain  # Keep as is for special cases
         
         # For regular domains, ensure they have a dot (except localhost)
@@ -644,7 +1147,7 @@ def extract_domain(url):
             
         # Improved validation: ensure domain has valid characters and structure
         # Allow letters, numbers, dots, hyphens, and underscores (common in internal domains)
-        if not re.match(r'^[a-zA-Z0-9._-]+$', domain):
+        if not _DOMAIN_CHARS_RE.match(domain):
             return str(url).lower()  # Return original if domain has invalid characters
         
         # Basic check: domain should not start or end with dot/hyphen
@@ -655,19 +1158,97 @@ def extract_domain(url):
     except Exception:
         return str(url).lower()  # Fallback to original URL if parsing fails
 
+def map_slices(series, func, min_rows=200_000):
+    """Run func on contiguous slices of an Arrow-backed Series in parallel threads.
+    
+    func returns a tuple of Series; each is concatenated back in row order.
+    Arrow compute kernels release the GIL, so the slices run on separate cores.
+    """
+    workers = os.cpu_count() or 1
+    if workers == 1 or len(series) < min_rows or not isinstance(series.dtype, pd.ArrowDtype):
+        return func(series)
+    bounds = np.linspace(0, len(series), workers + 1).astype(int)
+    with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        parts = list(executor.map(lambda start, stop: func(series.iloc[start:stop]), bounds[:-1], bounds[1:]))
+    return tuple(pd.concat(results) for results in zip(*parts))
+
+def _simple_domains(uris):
+    """Return (domain, is_simple) for plain scheme://host URLs using column-wide string operations."""
+    netloc = uris.str.extract(_SIMPLE_NETLOC_PATTERN, expand=False)
+    domain = netloc.str.lower().str.removeprefix('www.')
+    simple = (domain.str.match(_SIMPLE_DOMAIN_PATTERN, na=False).astype(bool)
+              & netloc.str.contains('.', regex=False, na=False).astype(bool))
+    return domain, simple
+
+def extract_domains(uris):
+    """Vectorized extract_domain() for a Series of URLs.
+    
+    Plain scheme://host URLs are resolved with a few column-wide string
+    operations; anything unusual (ports, IPs with ports, bare hostnames,
+    userinfo, IPv6) falls back to extract_domain() so results are identical.
+    """
+    domain, simple = map_slices(uris, _simple_domains)
+    
+    # Arrow-backed input keeps an Arrow-backed result, so later grouping and
+    # category encoding of the domains also run on Arrow kernels
+    result = domain.where(simple)
+    if not isinstance(result.dtype, pd.ArrowDtype):
+        result = result.astype(object)
+    if not simple.all():
+        # Unusual URIs repeat heavily (app ids, bare hosts), so each distinct
+        # value goes through extract_domain() once and is scattered back
+        codes, uniques = pd.factorize(uris[~simple], use_na_sentinel=False)
+        resolved = np.array([extract_domain(uri) for uri in uniques], dtype=object)
+        result[~simple] = resolved[codes]
+    
+    return result
+
 def add_domain_column(df):
     """Add domain column extracted from login_uri_normalized."""
     # Memory efficient: modify in place
     if 'login_uri_normalized' in df.columns:
         if TQDM_AVAILABLE and len(df) > 1000:
-            tqdm.pandas(desc="Extracting domains")
-            df['domain'] = df['login_uri_normalized'].progress_apply(extract_domain)
+            with tqdm(total=1, desc="Extracting domains") as pbar:
+                df['domain'] = extract_domains(df['login_uri_normalized'])
+                pbar.update(1)
         else:
-            df['domain'] = df['login_uri_normalized'].apply(extract_domain)
+            df['domain'] = extract_domains(df['login_uri_normalized'])
         print("Domain column added for duplicate detection")
     
     return df
 
+def strip_parenthesized(names):
+    """Remove parenthesized text from names, returning the result and how many entries changed."""
+    if isinstance(names.dtype, pd.ArrowDtype):
+        # Arrow kernels take pattern strings, and skipping the replace is cheap when nothing matches
+        count = int(names.str.contains(_PARENS_RE.pattern, na=False).sum())
+        if count:
+            names = names.str.replace(_PARENS_RE.pattern, '', regex=True)
+        return names, count
+    
+    # One pass with the compiled pattern both counts and rewrites each entry;
+    # the pattern can only match where a '(' is present
+    count = 0
+    values = names.to_numpy(dtype=object, copy=True)
+    for i, value in enumerate(values):
+        if isinstance(value, str) and '(' in value:
+            values[i], n = _PARENS_RE.subn('', value)
+            count += n > 0
+    return pd.Series(values, index=names.index, name=names.name, dtype=object), int(count)
+
+def collapse_whitespace(names):
+    """Collapse whitespace runs to one space and trim the ends of each name."""
+    if isinstance(names.dtype, pd.ArrowDtype):
+        return names.str.replace(_MULTISPACE_RE.pattern, ' ', regex=True).str.strip()
+    
+    # str.split() splits on exactly the characters \s matches, so one join per
+    # entry does the regex replace and the strip in a single pass
+    values = names.to_numpy(dtype=object, copy=True)
+    for i, value in enumerate(values):
+        if isinstance(value, str):
+            values[i] = ' '.join(value.split())
+    return pd.Series(values, index=names.index, name=names.name, dtype=object)
+
 def clean_name_column(df, logger=None):
     """Clean the name column by removing text in parentheses and extra whitespace."""
     if 'name' not in df.columns:
@@ -678,10 +1259,10 @@ def clean_name_column(df, logger=None):
     # Count entries that will be cleaned
     if TQDM_AVAILABLE and len(df) > 5000:
         with tqdm(total=1, desc="Checking name column") as pbar:
-            entries_with_parentheses = df['name'].str.contains(r'\([^)]*\)', na=False).sum()
+            names, entries_with_parentheses = strip_parenthesized(df['name'])
             pbar.update(1)
     else:
-        entries_with_parentheses = df['name'].str.contains(r'\([^)]*\)', na=False).sum()
+        names, entries_with_parentheses = strip_parenthesized(df['name'])
     
     if entries_with_parentheses == 0:
         if logger:
@@ -691,20 +1272,15 @@ def clean_name_column(df, logger=None):
     
     # Clean the name column
     if TQDM_AVAILABLE and len(df) > 5000:
-        with tqdm(total=2, desc="Cleaning name column") as pbar:
-            # Remove everything in parentheses including the parentheses themselves
-            df['name'] = df['name'].str.replace(r'\s*\([^)]*\)\s*', '', regex=True)
-            pbar.update(1)
-            
-            # Clean up any double spaces and strip whitespace
-            df['name'] = df['name'].str.replace(r'\s+', ' ', regex=True).str.strip()
+        with tqdm(total=1, desc="Cleaning name column") as pbar:
+            # Parenthesized text was already removed while counting; collapse
+            # spaces on that result and store the column once
+            df['name'] = collapse_whitespace(names)
             pbar.update(1)
     else:
-        # Remove everything in parentheses including the parentheses themselves
-        df['name'] = df['name'].str.replace(r'\s*\([^)]*\)\s*', '', regex=True)
-        
-        # Clean up any double spaces and strip whitespace
-        df['name'] = df['name'].str.replace(r'\s+', ' ', regex=True).str.strip()
+        # Parenthesized text was already removed while counting; collapse
+        # spaces on that result and store the column once
+        df['name'] = collapse_whitespace(names)
     
     message = f"Cleaned {entries_with_parentheses} entries in name column (removed parentheses content)"
     if logger:
@@ -713,10 +1289,50 @@ def clean_name_column(df, logger=None):
     
     return df
 
-def interactive_delete_duplicates(csv_file_path, logger=None, show_passwords=False):
+def _normalize_and_derive(df, logger=None, with_domain=True):
+    """Run normalize_urls, clean_name_column and add_domain_column as one stage.
+    
+    login_uri is read once and its normalized form feeds straight into domain
+    extraction, instead of each step re-reading a column of the frame.
+    """
+    if 'login_uri' in df.columns:
+        uri_normalized = strip_trailing_slashes(df['login_uri'])
+        if with_domain:
+            # A row whose username + password pair is unique can never be a domain
+            # duplicate, so domains are only extracted for rows sharing credentials
+            credential_columns = [col for col in ('login_username', 'login_password') if col in df.columns]
+            if credential_columns:
+                needs_domain = df.duplicated(subset=credential_columns, keep=False)
+            else:
+                needs_domain = pd.Series(True, index=df.index)
+            domain_dtype = uri_normalized.dtype if isinstance(uri_normalized.dtype, pd.ArrowDtype) else object
+            domain = pd.Series(None, index=df.index, dtype=domain_dtype)
+            if TQDM_AVAILABLE and len(df) > 1000:
+                with tqdm(total=1, desc="Extracting domains") as pbar:
+                    domain[needs_domain] = extract_domains(uri_normalized[needs_domain])
+                    pbar.update(1)
+            else:
+                domain[needs_domain] = extract_domains(uri_normalized[needs_domain])
+        
+        df['login_uri_normalized'] = uri_normalized
+        message = "URLs normalized (trailing slashes removed for duplicate detection)"
+        if logger:
+            logger.info(message)
+        print(message)
+    
+    df = clean_name_column(df, logger)
+    
+    if with_domain and 'login_uri' in df.columns:
+        df['domain'] = domain
+        print("Domain column added for duplicate detection")
+    
+    return df
+
+def interactive_delete_duplicates(csv_file_path, logger=None, show_passwords=False, df=None, deleted_format='csv'):
     """Interactive deletion with arrow key navigation, matching only on base URI."""
     try:
-        df = pd.read_csv(csv_file_path)
+        if df is None:
+            df = load_csv(csv_file_path)
         original_count = len(df)
         
         print("\n🔍 INTERACTIVE DUPLICATE CLEANUP")
@@ -733,8 +1349,7 @@ def interactive_delete_duplicates(csv_file_path, logger=None, show_passwords=Fal
         print("\n" + "=" * 50)
         print("STEP 1.5: Normalizing URLs and cleaning names")
         print("=" * 50)
-        df = normalize_urls(df, logger)
-        df = clean_name_column(df, logger)
+        df = _normalize_and_derive(df, logger, with_domain=False)
         
         required_columns = ['login_uri']
         missing_columns = [col for col in required_columns if col not in df.columns]
@@ -743,41 +1358,38 @@ def interactive_delete_duplicates(csv_file_path, logger=None, show_passwords=Fal
             print(f"Error: Missing columns: {missing_columns}")
             return None
         
-        # Find rows with duplicate login_uri (base URI only - changed from username+URI)
-        duplicate_uri_rows = df[df.duplicated(subset=['login_uri_normalized'], keep=False)]
+        # Find groups of rows with duplicate login_uri (base URI only - changed from
+        # username+URI); row positions of every group come from one sort instead
+        # of a scan per URI
+        uri_groups = duplicate_groups(df['login_uri_normalized'])
         
-        if duplicate_uri_rows.empty:
+        if not uri_groups:
             print("\nNo duplicate base URIs found after removing fully duplicate rows.")
             if fully_removed_count > 0:
                 print(f"Total cleanup: {fully_removed_count} fully duplicate rows removed.")
             # Clean up temporary columns
-            df_cleaned = df.drop(columns=['login_uri_normalized'], errors='ignore')
-            return df_cleaned
+            df.drop(columns=['login_uri_normalized'], inplace=True, errors='ignore')
+            return df
         
         print("\n" + "=" * 50)
         print("STEP 2: Interactive URI-based duplicate cleanup")
         print("=" * 50)
-        print(f"Found {len(duplicate_uri_rows)} rows with duplicate base URIs")
+        print(f"Found {sum(len(positions) for _, positions in uri_groups)} rows with duplicate base URIs")
         print("You'll be able to review each group and select accounts to remove")
         
         rows_to_delete = []
-        # Group by normalized login_uri only (removed username grouping)
-        unique_uris = duplicate_uri_rows['login_uri_normalized'].drop_duplicates()
         
-        print(f"\n📊 Processing {len(unique_uris)} unique base URIs with duplicates...")
+        print(f"\n📊 Processing {len(uri_groups)} unique base URIs with duplicates...")
         
         # Process each URI group
-        total_groups = len(unique_uris)
+        total_groups = len(uri_groups)
         current_group = 0
         
-        for uri_normalized in unique_uris:
+        for uri_normalized, positions in uri_groups:
             current_group += 1
             
-            # Get all rows with this specific normalized login_uri
-            uri_group = df[df['login_uri_normalized'] == uri_normalized].copy()
-            
-            if len(uri_group) < 2:  # Skip if only one entry
-                continue
+            # All rows with this specific normalized login_uri, in file order
+            uri_group = df.iloc[positions]
             
             # Create group info for display
             group_info = f"Base URI: {uri_normalized} ({current_group}/{total_groups})"
@@ -796,21 +1408,21 @@ def interactive_delete_duplicates(csv_file_path, logger=None, show_passwords=Fal
         
         # Process deletions
         if rows_to_delete:
-            # Get deleted entries before dropping them
-            deleted_df = df.loc[rows_to_delete].copy()
+            # Split deleted and kept rows with one vectorized index lookup
+            delete_mask = df.index.isin(rows_to_delete)
             
-            df_cleaned = df.drop(rows_to_delete)
-            df_cleaned.reset_index(drop=True, inplace=True)
+            # Remove the temporary columns once, before either output is selected
+            df.drop(columns=['login_uri_normalized'], inplace=True, errors='ignore')
+            deleted_df = df[delete_mask]
             
-            # Remove the temporary columns from final output
-            df_cleaned = df_cleaned.drop(columns=['login_uri_normalized'], errors='ignore')
-            deleted_df = deleted_df.drop(columns=['login_uri_normalized'], errors='ignore')
+            df_cleaned = df[~delete_mask]
+            df_cleaned.reset_index(drop=True, inplace=True)
             
             # Save deleted entries
-            save_deleted_entries(deleted_df, csv_file_path)
+            save_deleted_entries(deleted_df, csv_file_path, deleted_format)
             
             # Final summary
-            os.system('clear' if os.name == 'posix' else 'cls')
+            clear_screen()
             print("✅ CLEANUP COMPLETE!")
             print("=" * 50)
             print(f"📊 SUMMARY:")
@@ -830,8 +1442,8 @@ def interactive_delete_duplicates(csv_file_path, logger=None, show_passwords=Fal
                 print(f"Total cleanup: {fully_removed_count} fully duplicate rows removed.")
             
             # Remove temporary columns
-            df_cleaned = df.drop(columns=['login_uri_normalized'], errors='ignore')
-            return df_cleaned
+            df.drop(columns=['login_uri_normalized'], inplace=True, errors='ignore')
+            return df
             
     except FileNotFoundError:
         print(f"Error: File '{csv_file_path}' not found.")
@@ -843,11 +1455,15 @@ def interactive_delete_duplicates(csv_file_path, logger=None, show_passwords=Fal
         print(f"Error processing CSV file: {e}")
         return None
 
-def automatic_delete_duplicates(csv_file_path, logger=None, dry_run=False):
+def automatic_delete_duplicates(csv_file_path, logger=None, dry_run=False, df=None):
     """Automatically delete duplicate login_uri + login_username combinations, keeping only the first occurrence."""
     try:
-        df = pd.read_csv(csv_file_path)
+        if df is None:
+            df = load_csv(csv_file_path)
         original_count = len(df)
+        # The stages below only assign whole columns, which replaces them in a
+        # shallow copy without touching the caller's frame
+        working_df = df.copy(deep=False)
         
         if dry_run:
             print("\n🔍 DRY RUN MODE: Previewing changes without modification\n")
@@ -856,24 +1472,15 @@ def automatic_delete_duplicates(csv_file_path, logger=None, dry_run=False):
         print("\n" + "=" * 50)
         print("STEP 1: Removing fully duplicate rows")
         print("=" * 50)
+        working_df, fully_removed_count = remove_fully_duplicate_rows(working_df, logger)
         if dry_run:
-            df_temp, fully_removed_count = remove_fully_duplicate_rows(df.copy(), logger)
             print(f"DRY RUN: Would remove {fully_removed_count} fully duplicate rows")
-        else:
-            df, fully_removed_count = remove_fully_duplicate_rows(df, logger)
         
         # Normalize URLs for better duplicate detection
         print("\n" + "=" * 50)
         print("STEP 1.5: Normalizing URLs and cleaning names")
         print("=" * 50)
-        if dry_run:
-            df_temp = normalize_urls(df_temp, logger)
-            df_temp = clean_name_column(df_temp, logger)
-            working_df = df_temp
-        else:
-            df = normalize_urls(df, logger)
-            df = clean_name_column(df, logger)
-            working_df = df
+        working_df = _normalize_and_derive(working_df, logger, with_domain=False)
         
         required_columns = ['login_uri', 'login_username']
         missing_columns = [col for col in required_columns if col not in working_df.columns]
@@ -882,35 +1489,39 @@ def automatic_delete_duplicates(csv_file_path, logger=None, dry_run=False):
             print(f"Error: Missing columns: {missing_columns}")
             return None, None
         
-        # Find rows with duplicate login_uri AND login_username combinations (using normalized URLs)
-        duplicate_uri_username_rows = working_df[working_df.duplicated(subset=['login_uri_normalized', 'login_username'], keep=False)]
+        # Dictionary-encoding the key columns lets the grouping below hash integer
+        # codes. The normalized column is dropped before output, so its dtype
+        # never leaks.
+        key_columns = ['login_uri_normalized', 'login_username']
+        working_df = categorize_columns(working_df, key_columns)
+        
+        # Find duplicate login_uri AND login_username combinations (using normalized
+        # URLs) and the shortest URI of every combination in one grouping pass
+        duplicate_combinations, keep_mask = count_and_pick_shortest(working_df, key_columns, min_count=2)
         
-        if duplicate_uri_username_rows.empty:
+        if duplicate_combinations.empty:
             print("\nNo remaining duplicate login_uri + login_username combinations found after removing fully duplicate rows.")
             if fully_removed_count > 0:
                 if dry_run:
                     print(f"DRY RUN: Would clean {fully_removed_count} fully duplicate rows total.")
                 else:
                     print(f"Total cleanup: {fully_removed_count} fully duplicate rows removed.")
-            return df, pd.DataFrame()  # Return empty DataFrame for deleted rows
+            if dry_run:
+                return df, pd.DataFrame()  # Return original data unchanged
+            working_df.drop(columns=['login_uri_normalized'], inplace=True, errors='ignore')
+            return working_df, pd.DataFrame()  # Return empty DataFrame for deleted rows
         
         print("\n" + "=" * 50)
         print("STEP 2: Automatic partial duplicate cleanup")
         print("=" * 50)
-        print(f"Found {len(duplicate_uri_username_rows)} rows with duplicate login_uri + login_username combinations")
+        print(f"Found {duplicate_combinations.sum()} rows with duplicate login_uri + login_username combinations")
         
-        # Keep only the shortest URI for each normalized login_uri + login_username combination
-        def keep_shortest_uri_auto(group):
-            # Memory efficient: find shortest without creating extra columns
-            min_length_idx = group['login_uri_normalized'].str.len().idxmin()
-            return group.loc[[min_length_idx]]
-        
-        # Group by normalized URI + username and apply the shortest URI selection
-        df_cleaned = working_df.groupby(['login_uri_normalized', 'login_username'], group_keys=False).apply(keep_shortest_uri_auto).reset_index(drop=True)
-        
-        # Find the rows that were removed
-        removed_indices = set(working_df.index) - set(df_cleaned.index)
-        deleted_rows = working_df.loc[list(removed_indices)]
+        # Keep only the shortest URI for each normalized login_uri + login_username
+        # combination, using keep_mask from the grouping above. The normalized
+        # column is dropped first, so neither output needs copying without it
+        working_df.drop(columns=['login_uri_normalized'], inplace=True, errors='ignore')
+        df_cleaned = working_df[keep_mask].reset_index(drop=True)
+        deleted_rows = working_df[~keep_mask]
         
         partial_removed_count = len(deleted_rows)
         
@@ -919,12 +1530,6 @@ def automatic_delete_duplicates(csv_file_path, logger=None, dry_run=False):
         else:
             print(f"Automatically removed {partial_removed_count} duplicate login_uri + login_username entries (kept shortest URI)")
         
-        # Remove the normalized column from final output (it was just for comparison)
-        if 'login_uri_normalized' in df_cleaned.columns:
-            df_cleaned = df_cleaned.drop('login_uri_normalized', axis=1)
-        if 'login_uri_normalized' in deleted_rows.columns:
-            deleted_rows = deleted_rows.drop('login_uri_normalized', axis=1)
-        
         print(f"\n{'='*50}")
         if dry_run:
             print(f"DRY RUN SUMMARY:")
@@ -953,6 +1558,35 @@ def automatic_delete_duplicates(csv_file_path, logger=None, dry_run=False):
         print(f"Error processing CSV file: {e}")
         return None, None
 
+def copy_file(src, dst, chunk_size=16 << 20):
+    """Copy a file with its metadata, like shutil.copy2.
+    
+    On Linux the data goes through os.copy_file_range, which stays in the
+    kernel and lets copy-on-write filesystems (btrfs, XFS) share extents instead
+    of moving data. Filesystems that refuse it fall back to shutil.copyfile.
+    """
+    if hasattr(os, 'copy_file_range'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            copied = 0
+            try:
+                while True:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), chunk_size)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError as e:
+                # Unsupported across these filesystems; nothing has been written
+                # yet, so the portable copy below starts cleanly
+                if copied or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP,
+                                             errno.EINVAL, errno.EPERM, errno.EBADF):
+                    raise
+            else:
+                shutil.copystat(src, dst)
+                return dst
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
 def create_backup(original_path, logger=None):
     """Create a backup of the original file before any modifications."""
     try:
@@ -960,15 +1594,14 @@ def create_backup(original_path, logger=None):
         if not Path(original_path).exists():
             raise FileNotFoundError(f"Original file not found: {original_path}")
         
-        base_name = original_path.rsplit('.', 1)[0]
-        extension = original_path.rsplit('.', 1)[1] if '.' in original_path else 'csv'
+        base_name, extension = split_extension(original_path)
         
         # Add timestamp to backup files
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = f"{base_name}_backup_{timestamp}.{extension}"
         
-        # Create backup using shutil for better file handling
-        shutil.copy2(original_path, backup_path)
+        # Kernel-side copy (a reflink where the filesystem supports it), keeping metadata like copy2
+        copy_file(original_path, backup_path)
         
         message = f"Original file backed up to: {backup_path}"
         if logger:
@@ -984,21 +1617,30 @@ def create_backup(original_path, logger=None):
         print(f"❌ {error_msg}")
         return None
 
-def save_deleted_entries(deleted_df, original_path):
-    """Save deleted entries to a backup file."""
+def save_deleted_entries(deleted_df, original_path, file_format='csv'):
+    """Save deleted entries to a backup file (CSV, or zstd-compressed Parquet)."""
     if deleted_df is None or deleted_df.empty:
         print("No deleted entries to save.")
         return None
     
-    base_name = original_path.rsplit('.', 1)[0]
-    extension = original_path.rsplit('.', 1)[1] if '.' in original_path else 'csv'
+    base_name, extension = split_extension(original_path)
+    
+    if file_format == 'parquet' and not PYARROW_AVAILABLE:
+        print("⚠️  Parquet output requires pyarrow (pip install pyarrow); saving deleted entries as CSV")
+        file_format = 'csv'
+    if file_format == 'parquet':
+        extension = 'parquet'
     
     # Add timestamp to backup files for multiple backups
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     deleted_path = f"{base_name}_deleted_entries_{timestamp}.{extension}"
     
     try:
-        deleted_df.to_csv(deleted_path, index=False)
+        if file_format == 'parquet':
+            # Columnar, compressed write without formatting every cell as text
+            deleted_df.to_parquet(deleted_path, engine='pyarrow', compression='zstd', index=False)
+        else:
+            write_csv(deleted_df, deleted_path)
         print(f"Deleted entries saved to: {deleted_path}")
         return deleted_path
     except Exception as e:
@@ -1007,21 +1649,35 @@ def save_deleted_entries(deleted_df, original_path):
 
 def list_backup_files(original_path):
     """List available backup files for the given original file."""
-    base_name = original_path.rsplit('.', 1)[0]
-    extension = original_path.rsplit('.', 1)[1] if '.' in original_path else 'csv'
+    base_name, extension = split_extension(original_path)
+    
+    directory, base = os.path.split(base_name)
     
-    # Look for backup patterns
+    # Look for backup patterns (matched against file names in the directory)
     backup_patterns = [
-        f"{base_name}_backup_*.{extension}",
-        f"{base_name}_deleted_entries_*.{extension}",
-        f"{base_name}_cleaned.{extension}"
+        f"{base}_backup_*.{extension}",
+        f"{base}_deleted_entries_*.{extension}",
+        f"{base}_cleaned.{extension}"
     ]
+    if extension != 'parquet':
+        backup_patterns.insert(2, f"{base}_deleted_entries_*.parquet")
     
-    backup_files = []
-    
-    for pattern in backup_patterns:
-        matches = glob(pattern)
-        backup_files.extend(matches)
+    # One directory scan for every pattern; the stat each entry carries is kept
+    # for the sort and the listing below
+    matches = [[] for _ in backup_patterns]
+    try:
+        with os.scandir(directory or '.') as entries:
+            for entry in entries:
+                if not entry.name.startswith(base):
+                    continue
+                for pattern_matches, pattern in zip(matches, backup_patterns):
+                    if fnmatch.fnmatch(entry.name, pattern):
+                        pattern_matches.append((os.path.join(directory, entry.name), entry.stat()))
+                        break
+    except FileNotFoundError:
+        pass
+    backup_stats = dict(match for pattern_matches in matches for match in pattern_matches)
+    backup_files = list(backup_stats)
     
     if not backup_files:
         print(f"No backup files found for: {original_path}")
@@ -1030,12 +1686,14 @@ def list_backup_files(original_path):
     print(f"\n💾 Available backup files for {original_path}:")
     print("=" * 60)
     
-    backup_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+    backup_files.sort(key=lambda x: backup_stats[x].st_mtime, reverse=True)
     
+    listing = []
     for i, backup_file in enumerate(backup_files, 1):
         file_path = Path(backup_file)
-        size_mb = file_path.stat().st_size / (1024 * 1024)
-        mod_time = datetime.datetime.fromtimestamp(file_path.stat().st_mtime)
+        stat = backup_stats[backup_file]
+        size_mb = stat.st_size / (1024 * 1024)
+        mod_time = datetime.datetime.fromtimestamp(stat.st_mtime)
         
         if "backup_" in backup_file:
             file_type = "Original file backup"
@@ -1046,11 +1704,14 @@ def list_backup_files(original_path):
         else:
             file_type = "Backup file"
         
-        print(f"{i:2d}. {file_path.name}")
-        print(f"    Type: {file_type}")
-        print(f"    Size: {size_mb:.1f} MB")
-        print(f"    Modified: {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
+        listing.extend([
+            f"{i:2d}. {file_path.name}",
+            f"    Type: {file_type}",
+            f"    Size: {size_mb:.1f} MB",
+            f"    Modified: {mod_time.strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+        ])
+    print_lines(listing)
     
     return backup_files
 
@@ -1090,8 +1751,7 @@ def restore_from_backup(original_path, backup_file=None, interactive=True):
         selected_backup = backup_files[0]
     
     # Determine restore type and method
-    base_name = original_path.rsplit('.', 1)[0]
-    extension = original_path.rsplit('.', 1)[1] if '.' in original_path else 'csv'
+    base_name, extension = split_extension(original_path)
     
     if "deleted_entries" in selected_backup:
         # This is a deleted entries backup - need to merge with current cleaned file
@@ -1107,8 +1767,11 @@ def restore_from_backup(original_path, backup_file=None, interactive=True):
         
         try:
             # Read both files
-            deleted_df = pd.read_csv(selected_backup)
-            cleaned_df = pd.read_csv(cleaned_file)
+            if selected_backup.endswith('.parquet'):
+                deleted_df = pd.read_parquet(selected_backup)
+            else:
+                deleted_df = load_csv(selected_backup)
+            cleaned_df = load_csv(cleaned_file)
             
             # Combine them
             restored_df = pd.concat([cleaned_df, deleted_df], ignore_index=True)
@@ -1117,7 +1780,7 @@ def restore_from_backup(original_path, backup_file=None, interactive=True):
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             restore_path = f"{base_name}_restored_{timestamp}.{extension}"
             
-            restored_df.to_csv(restore_path, index=False)
+            write_csv(restored_df, restore_path)
             
             print(f"✅ Successfully restored {len(deleted_df)} deleted entries")
             print(f"Combined {len(cleaned_df)} cleaned + {len(deleted_df)} deleted = {len(restored_df)} total entries")
@@ -1144,7 +1807,7 @@ def restore_from_backup(original_path, backup_file=None, interactive=True):
         
         try:
             # Copy the backup to original location
-            shutil.copy2(selected_backup, original_path)
+            copy_file(selected_backup, original_path)
             
             print(f"✅ Successfully restored original file to: {original_path}")
             return True
@@ -1168,7 +1831,7 @@ def restore_from_backup(original_path, backup_file=None, interactive=True):
         
         try:
             # Copy the backup to original location
-            shutil.copy2(selected_backup, original_path)
+            copy_file(selected_backup, original_path)
             
             print(f"✅ Successfully restored file to: {original_path}")
             return True
@@ -1181,6 +1844,20 @@ def restore_from_backup(original_path, backup_file=None, interactive=True):
         print(f"❌ Error: Unknown backup file type: {selected_backup}")
         return False
 
+def _containment_pairs(uris):
+    """Yield (shorter, longer) pairs of distinct URIs where one contains the other.
+    
+    Sorted by length, a URI can only be contained in the ones after it, so each
+    URI is searched for in that remaining tail with one vectorized substring
+    check instead of a Python loop over every pair.
+    """
+    by_length = sorted(uris, key=len)
+    candidates = pd.Series(by_length, dtype=object)
+    for i, uri in enumerate(by_length[:-1]):
+        tail = candidates.iloc[i + 1:]
+        for longer in tail[tail.str.contains(uri, regex=False)]:
+            yield uri, longer
+
 def find_partial_uri_matches(df):
     """Find rows with partial URI matches but same username and password."""
     required_columns = ['login_uri_normalized', 'login_username', 'login_password']
@@ -1190,37 +1867,171 @@ def find_partial_uri_matches(df):
         print(f"Warning: Cannot check partial URI matches. Missing columns: {missing_columns}")
         return []
     
-    # Group by username and password combinations
-    credential_groups = df.groupby(['login_username', 'login_password'])
+    # Group by username and password combinations on integer codes, numbered in
+    # first-seen order. Only credentials used more than once can match, so
+    # single-entry groups are dropped before any per-group frame is built, and
+    # rows missing either value are skipped like groupby() does.
+    credential_columns = ['login_username', 'login_password']
+    codes, _ = _combination_codes(df, credential_columns)
+    group_codes = pd.DataFrame(codes).groupby(credential_columns, sort=False).ngroup().to_numpy()
+    group_codes[(codes['login_username'] < 0) | (codes['login_password'] < 0)] = -1
+    
+    runs = _repeated_runs(group_codes)[1]
+    if not runs:
+        return []
+    # One take in run order; each group is then a cheap contiguous slice
+    shared = df.iloc[np.concatenate(runs)]
+    bounds = np.cumsum([0] + [len(positions) for positions in runs]).tolist()
     
     partial_match_groups = []
     
-    for (username, password), group in credential_groups:
-        if len(group) > 1:  # More than one entry with same credentials
-            unique_uris = group['login_uri_normalized'].unique()
-            if len(unique_uris) > 1:  # Different URIs for same credentials
-                # Check if URIs are partial matches (one contains the other)
-                potential_matches = []
-                for i, uri1 in enumerate(unique_uris):
-                    for j, uri2 in enumerate(unique_uris):
-                        if i != j and (uri1 in uri2 or uri2 in uri1):
-                            potential_matches.append((uri1, uri2))
-                
-                if potential_matches:
-                    partial_match_groups.append({
-                        'username': username,
-                        'password': password,
-                        'group': group,
-                        'uris': unique_uris,
-                        'matches': potential_matches
-                    })
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        # Every run holds more than one entry with the same credentials
+        group = shared.iloc[start:end]
+        username, password = group['login_username'].iat[0], group['login_password'].iat[0]
+        unique_uris = group['login_uri_normalized'].dropna().unique()
+        if len(unique_uris) > 1:  # Different URIs for same credentials
+            # Check if URIs are partial matches (one contains the other)
+            potential_matches = []
+            for shorter, longer in _containment_pairs(unique_uris):
+                potential_matches.append((shorter, longer))
+                potential_matches.append((longer, shorter))
+            
+            if potential_matches:
+                partial_match_groups.append({
+                    'username': username,
+                    'password': password,
+                    'group': group,
+                    'uris': unique_uris,
+                    'matches': potential_matches
+                })
     
     return partial_match_groups
 
-def automatic_domain_cleanup(csv_file_path, logger=None, dry_run=False):
+def _pipeline_polars(csv_file_path, logger=None, df=None):
+    """Prepare the domain cleanup frame with one lazy Polars query.
+    
+    Returns the pandas working frame (with login_uri_normalized, domain and
+    cleaned names) and a boolean keep mask marking the shortest-URI row of
+    each domain + username + password combination. An already loaded df is
+    converted instead of parsing the file again.
+    """
+    if not POLARS_AVAILABLE:
+        raise ImportError("The polars engine requires polars (pip install polars)")
+    
+    if df is not None:
+        # Categorical username/password columns go back to plain strings, as scanned
+        lf = pl.from_pandas(df).lazy().with_columns(pl.all().cast(pl.String)).with_row_index('__row')
+    else:
+        # The same missing-value markers as load_csv(), so both engines keep the same rows
+        lf = pl.scan_csv(csv_file_path, infer_schema=False, row_index_name='__row',
+                         null_values=_PANDAS_NA_VALUES)
+    columns = lf.collect_schema().names()
+    
+    if 'login_uri' in columns:
+        lf = lf.with_columns(
+            pl.col('login_uri').str.strip_chars_end('/').alias('login_uri_normalized')
+        ).with_columns(
+            pl.col('login_uri_normalized').str.extract(_SIMPLE_NETLOC_PATTERN, 1).alias('__netloc')
+        ).with_columns(
+            pl.col('__netloc').str.to_lowercase().str.strip_prefix('www.').alias('domain')
+        ).with_columns(
+            (pl.col('domain').str.contains(_SIMPLE_DOMAIN_PATTERN)
+             & pl.col('__netloc').str.contains('.', literal=True)).fill_null(False).alias('__simple')
+        )
+    if 'name' in columns:
+        # Same rule as clean_name_column(): only rewrite names if any contain parentheses
+        lf = lf.with_columns(
+            pl.when(pl.col('name').str.contains(_PARENS_RE.pattern).any())
+              .then(pl.col('name').str.replace_all(_PARENS_RE.pattern, '')
+                    .str.replace_all(_MULTISPACE_RE.pattern, ' ').str.strip_chars())
+              .otherwise(pl.col('name'))
+        )
+    
+    frame = lf.collect(engine='streaming')
+    
+    if 'login_uri' in columns:
+        # Unusual URIs use the scalar extract_domain() like the pandas path, once
+        # per distinct value
+        unusual = frame.select(pl.arg_where(~pl.col('__simple'))).to_series()
+        if len(unusual):
+            unusual_uris = frame['login_uri_normalized'].gather(unusual)
+            uniques = unusual_uris.unique(maintain_order=True)
+            fallback = unusual_uris.replace_strict(
+                uniques, [extract_domain(uri) for uri in uniques], return_dtype=pl.String)
+            frame = frame.with_columns(frame['domain'].scatter(unusual, fallback))
+        frame = frame.drop('__simple', '__netloc')
+    
+    keep_mask = None
+    keys = ['domain', 'login_username', 'login_password']
+    if all(key in frame.columns for key in keys):
+        kept_rows = frame.lazy().group_by(keys).agg(
+            pl.col('__row').sort_by(pl.col('login_uri_normalized').str.len_chars(), pl.col('__row')).first()
+        ).collect(engine='streaming')['__row']
+        keep_mask = frame['__row'].is_in(kept_rows.implode()).to_numpy()
+    
+    frame = frame.drop('__row')
+    if PYARROW_AVAILABLE:
+        working_df = frame.to_pandas(use_pyarrow_extension_array=True)
+    else:
+        working_df = pd.DataFrame(frame.to_dict(as_series=False))
+    
+    message = f"Prepared {len(working_df)} rows with the Polars lazy engine"
+    if logger:
+        logger.info(message)
+    print(message)
+    
+    return working_df, keep_mask
+
+# Shown by both domain cleanups before asking for confirmation
+_DOMAIN_CLEANUP_WARNING = (
+    "\n" + "⚠️" * 50,
+    "⚠️  DATA LOSS WARNING",
+    "⚠️" * 50,
+    "This operation will PERMANENTLY DELETE entries from your dataset!",
+    "What will be deleted:",
+    "  • Longer URLs (keeps shortest URL for each credential set)",
+    "  • URL paths, parameters, and specific endpoints",
+    "  • Backup entries for the same login credentials",
+    "\nWhat will be PRESERVED:",
+    "  ✓ One entry per unique domain + username + password combination",
+    "  ✓ The shortest/base URL for each credential set",
+    "  ✓ All entries with different passwords (even same domain + username)",
+    "\nDeleted entries will be saved to a backup file for recovery.",
+)
+
+def print_preview_entries(entries):
+    """Print URI, username, masked password and name for each row of a preview frame."""
+    # Pull plain column arrays once instead of building a Series per row
+    names = entries['name'].to_numpy() if 'name' in entries.columns else None
+    columns = zip(entries.index, entries['login_uri'].to_numpy(),
+                  entries['login_username'].to_numpy(), entries['login_password'].to_numpy())
+    # Build the whole preview first and write it in a single print call
+    lines = []
+    for i, (idx, uri, username, password) in enumerate(columns):
+        lines.append(f"\n  Row {idx + 1}:")
+        lines.append(f"    URI: {uri}")
+        lines.append(f"    Username: {username}")
+        lines.append(f"    Password: {password_mask(len(str(password)))}")
+        if names is not None:
+            lines.append(f"    Name: {names[i]}")
+    if lines:
+        print('\n'.join(lines))
+
+def automatic_domain_cleanup(csv_file_path, logger=None, dry_run=False, df=None, engine='pandas', prefetch=True):
     """Automatically clean up entries with same domain + username, keeping only the first occurrence."""
     try:
-        df = pd.read_csv(csv_file_path)
+        keep_mask = None
+        if engine == 'polars' and not POLARS_AVAILABLE:
+            warning_msg = "Polars engine requested but polars is not installed (pip install polars); using pandas"
+            if logger:
+                logger.warning(warning_msg)
+            print(f"⚠️  {warning_msg}")
+            engine = 'pandas'
+        if engine == 'polars':
+            df, keep_mask = _pipeline_polars(csv_file_path, logger, df=df)
+        elif df is None:
+            df = load_csv(csv_file_path)
         original_count = len(df)
         
         if dry_run:
@@ -1231,11 +2042,13 @@ def automatic_domain_cleanup(csv_file_path, logger=None, dry_run=False):
         print("DOMAIN-BASED DUPLICATE CLEANUP")
         print("=" * 60)
         
-        # Work on a copy for dry run
-        working_df = df.copy() if dry_run else df
-        working_df = normalize_urls(working_df, logger)
-        working_df = clean_name_column(working_df, logger)
-        working_df = add_domain_column(working_df)
+        if engine == 'polars':
+            working_df = df
+        else:
+            # Dry runs work on a shallow copy: the stages below only assign whole
+            # columns, which replaces them in the copy without touching df's data
+            working_df = df.copy(deep=False) if dry_run else df
+            working_df = _normalize_and_derive(working_df, logger)
         
         required_columns = ['login_uri', 'login_username', 'login_password']
         missing_columns = [col for col in required_columns if col not in working_df.columns]
@@ -1251,116 +2064,88 @@ def automatic_domain_cleanup(csv_file_path, logger=None, dry_run=False):
         
         print("Looking for entries with same domain + username + password combinations...")
         
-        # Find duplicates based on domain + username + password
-        domain_credentials_duplicates = working_df[working_df.duplicated(subset=['domain', 'login_username', 'login_password'], keep=False)]
+        # Repeated domains/usernames group on integer category codes instead of strings
+        working_df = categorize_columns(working_df, ['domain', 'login_username', 'login_password'])
+        
+        # Count every domain + username + password combination on integer group codes;
+        # the shortest-URI pick for the preview and cleanup reuses the same grouping
+        # (the Polars pipeline has already picked its rows)
+        key_columns = ['domain', 'login_username', 'login_password']
+        if keep_mask is None:
+            duplicate_combinations, keep_mask = count_and_pick_shortest(working_df, key_columns, min_count=2)
+        else:
+            duplicate_combinations = count_combinations(working_df, key_columns, min_count=2)
         
-        if domain_credentials_duplicates.empty:
+        if duplicate_combinations.empty:
             print("No duplicate domain + username + password combinations found.")
-            # Clean up temporary columns
-            df_cleaned = working_df.drop(['login_uri_normalized', 'domain'], axis=1, errors='ignore')
+            # Clean up temporary columns (working_df is df itself unless this is a dry run)
+            working_df.drop(columns=['login_uri_normalized', 'domain'], inplace=True, errors='ignore')
             return df, pd.DataFrame()  # Return original data for dry run
         
-        print(f"Found {len(domain_credentials_duplicates)} rows with duplicate domain + username + password combinations")
+        print(f"Found {duplicate_combinations.sum()} rows with duplicate domain + username + password combinations")
         
         # Show summary of what will be cleaned
-        unique_combinations = domain_credentials_duplicates[['domain', 'login_username', 'login_password']].drop_duplicates()
         action_word = "Would clean" if dry_run else "Will clean"
-        print(f"\n{action_word} {len(unique_combinations)} unique domain + username + password combinations:")
-        
-        total_to_remove = 0
-        combo_iterator = tqdm(unique_combinations.iterrows(), 
-                             total=len(unique_combinations), 
-                             desc="Analyzing combinations") if TQDM_AVAILABLE and len(unique_combinations) > 50 else unique_combinations.iterrows()
-        
-        for _, combo in combo_iterator:
-            domain = combo['domain']
-            username = combo['login_username']
-            password_masked = '*' * len(str(combo['login_password']))  # Mask password for security
-            count = len(working_df[(working_df['domain'] == domain) & (working_df['login_username'] == username) & (working_df['login_password'] == combo['login_password'])])
-            total_to_remove += (count - 1)  # Will keep 1, remove others
-            action_word = "would keep" if dry_run else "keep"
-            print(f"  - Domain: {domain}, Username: {username}, Password: {password_masked} ({count} entries → {action_word} 1, remove {count-1})")
+        print(f"\n{action_word} {len(duplicate_combinations)} unique domain + username + password combinations:")
+        
+        # Every combination keeps 1 entry and removes the others
+        total_to_remove = int(duplicate_combinations.sum()) - len(duplicate_combinations)
+        # Plain per-level arrays zip far faster than iterating the MultiIndex,
+        # which rebuilds a tuple from its levels and codes for every combination
+        levels = [duplicate_combinations.index.get_level_values(col).to_numpy(dtype=object) for col in key_columns]
+        combos = zip(*levels, duplicate_combinations.to_numpy().tolist())
+        combo_iterator = tqdm(combos, 
+                             total=len(duplicate_combinations), 
+                             desc="Analyzing combinations") if TQDM_AVAILABLE and len(duplicate_combinations) > 50 else combos
+        
+        keep_word = "would keep" if dry_run else "keep"
+        # Passwords are masked for security; lines are written in blocks rather
+        # than with a print per combination
+        print_lines(f"  - Domain: {domain}, Username: {username}, Password: {password_mask(len(str(password)))} "
+                    f"({count} entries → {keep_word} 1, remove {count-1})"
+                    for domain, username, password, count in combo_iterator)
         
         action_word = "Would remove" if dry_run else "Will remove"
         print(f"\nSUMMARY: {action_word} {total_to_remove} entries total, keeping shortest URI for each domain + username + password combination.")
         
-        # Add data loss warnings
-        print("\n" + "⚠️" * 50)
-        print("⚠️  DATA LOSS WARNING")
-        print("⚠️" * 50)
-        print("This operation will PERMANENTLY DELETE entries from your dataset!")
-        print("What will be deleted:")
-        print("  • Longer URLs (keeps shortest URL for each credential set)")
-        print("  • URL paths, parameters, and specific endpoints")
-        print("  • Backup entries for the same login credentials")
-        print("\nWhat will be PRESERVED:")
-        print("  ✓ One entry per unique domain + username + password combination")
-        print("  ✓ The shortest/base URL for each credential set")
-        print("  ✓ All entries with different passwords (even same domain + username)")
-        print("\nDeleted entries will be saved to a backup file for recovery.")
-        
-        # Show preview of what will be deleted
-        print(f"\n{'='*60}")
-        print("PREVIEW: DATA TO BE DELETED")
-        print(f"{'='*60}")
-        
-        # Simulate the deletion to show what will be removed
-        def preview_shortest_uri(group):
-            min_length_idx = group['login_uri_normalized'].str.len().idxmin()
-            return group.loc[[min_length_idx]]
-        
-        # Get what would be kept
-        preview_kept = df.groupby(['domain', 'login_username', 'login_password'], group_keys=False).apply(preview_shortest_uri).reset_index(drop=True)
-        preview_deleted_indices = set(df.index) - set(preview_kept.index)
-        preview_deleted = df.loc[list(preview_deleted_indices)]
-        
-        if len(preview_deleted) <= 10:
+        # Add data loss warnings, then show preview of what will be deleted
+        print_lines([
+            *_DOMAIN_CLEANUP_WARNING,
+            f"\n{'='*60}",
+            "PREVIEW: DATA TO BE DELETED",
+            f"{'='*60}",
+        ])
+        
+        # Simulate the deletion to show what will be removed. Only positions are
+        # needed here; the preview takes at most 10 rows, so the kept/deleted
+        # frames are not materialized until the final step
+        kept_positions = np.flatnonzero(keep_mask)
+        deleted_positions = np.flatnonzero(~keep_mask)
+        
+        if len(deleted_positions) <= 10:
             # Show all deleted entries if 10 or fewer
             print("All entries that will be DELETED:")
-            for idx, row in preview_deleted.iterrows():
-                print(f"\n  Row {idx + 1}:")
-                print(f"    URI: {row['login_uri']}")
-                print(f"    Username: {row['login_username']}")
-                print(f"    Password: {'*' * len(str(row['login_password']))}")
-                if 'name' in row:
-                    print(f"    Name: {row['name']}")
+            print_preview_entries(working_df.iloc[deleted_positions])
         else:
             # Show first 5 and last 5 if more than 10
             print("Sample of entries that will be DELETED (showing first 5 and last 5):")
-            preview_sample = pd.concat([preview_deleted.head(5), preview_deleted.tail(5)])
-            for idx, row in preview_sample.iterrows():
-                print(f"\n  Row {idx + 1}:")
-                print(f"    URI: {row['login_uri']}")
-                print(f"    Username: {row['login_username']}")
-                print(f"    Password: {'*' * len(str(row['login_password']))}")
-                if 'name' in row:
-                    print(f"    Name: {row['name']}")
-            if len(preview_deleted) > 10:
-                print(f"\n  ... and {len(preview_deleted) - 10} more entries")
+            sample_positions = np.concatenate([deleted_positions[:5], deleted_positions[-5:]])
+            print_preview_entries(working_df.iloc[sample_positions])
+            if len(deleted_positions) > 10:
+                print(f"\n  ... and {len(deleted_positions) - 10} more entries")
         
         print(f"\n{'='*60}")
         print("PREVIEW: DATA TO BE KEPT")
         print(f"{'='*60}")
         
-        if len(preview_kept) <= 5:
+        # Kept rows are numbered as in the cleaned output
+        if len(kept_positions) <= 5:
             print("All entries that will be KEPT (shortest URLs):")
-            for idx, row in preview_kept.iterrows():
-                print(f"\n  Row {idx + 1}:")
-                print(f"    URI: {row['login_uri']}")
-                print(f"    Username: {row['login_username']}")
-                print(f"    Password: {'*' * len(str(row['login_password']))}")
-                if 'name' in row:
-                    print(f"    Name: {row['name']}")
+            print_preview_entries(working_df.iloc[kept_positions].reset_index(drop=True))
         else:
             print("Sample of entries that will be KEPT (showing first 5):")
-            for idx, row in preview_kept.head(5).iterrows():
-                print(f"\n  Row {idx + 1}:")
-                print(f"    URI: {row['login_uri']}")
-                print(f"    Username: {row['login_username']}")
-                print(f"    Password: {'*' * len(str(row['login_password']))}")
-                if 'name' in row:
-                    print(f"    Name: {row['name']}")
-            print(f"\n  ... and {len(preview_kept) - 5} more entries will be kept")
+            print_preview_entries(working_df.iloc[kept_positions[:5]].reset_index(drop=True))
+            print(f"\n  ... and {len(kept_positions) - 5} more entries will be kept")
         
         if dry_run:
             print(f"\n🔍 DRY RUN COMPLETE: Would delete {total_to_remove} entries and keep {len(working_df) - total_to_remove} entries.")
@@ -1372,37 +2157,37 @@ def automatic_domain_cleanup(csv_file_path, logger=None, dry_run=False):
         print("PROCEED WITH DELETION?")
         print(f"{'='*60}")
         print(f"This will delete {total_to_remove} entries and keep {len(working_df) - total_to_remove} entries.")
-        confirmation = input("Type 'DELETE' to confirm, or 'n' to cancel: ").strip()
+        
+        # For each domain + username + password combination, keep the entry with the shortest URI.
+        # Temporary columns are left out by position, so working_df itself is not
+        # modified and the split can run while the prompt below waits for the user
+        # (the deleted rows are written to a backup)
+        output_columns = [i for i, col in enumerate(working_df.columns)
+                          if col not in ('login_uri_normalized', 'domain')]
+        def split_rows():
+            return (working_df.iloc[kept_positions, output_columns].reset_index(drop=True),
+                    working_df.iloc[deleted_positions, output_columns])
+        
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            pending_split = executor.submit(split_rows) if prefetch else None
+            confirmation = input("Type 'DELETE' to confirm, or 'n' to cancel: ").strip()
         
         if confirmation.upper() != 'DELETE':
             print("Domain cleanup cancelled by user.")
             # Clean up temporary columns
-            df_cleaned = working_df.drop(['login_uri_normalized', 'domain'], axis=1, errors='ignore')
+            working_df.drop(columns=['login_uri_normalized', 'domain'], inplace=True, errors='ignore')
             return df, pd.DataFrame()
         
         print("\nProceeding with domain cleanup...")
         
-        # For each domain + username combination, keep the entry with the shortest URI
-        def keep_shortest_uri(group):
-            # Memory efficient: find shortest without creating extra columns
-            min_length_idx = group['login_uri_normalized'].str.len().idxmin()
-            return group.loc[[min_length_idx]]
-        
-        # Group by domain + username + password and apply the shortest URI selection
-        df_cleaned = working_df.groupby(['domain', 'login_username', 'login_password'], group_keys=False).apply(keep_shortest_uri).reset_index(drop=True)
-        
-        # Find the rows that were removed
-        removed_indices = set(working_df.index) - set(df_cleaned.index)
-        deleted_rows = working_df.loc[list(removed_indices)]
+        df_cleaned, deleted_rows = pending_split.result() if pending_split else split_rows()
+        # Both outputs are copies, so the temporary columns can be released from
+        # working_df (the caller's frame) before anything is written
+        working_df.drop(columns=['login_uri_normalized', 'domain'], inplace=True, errors='ignore')
+        gc.collect()
         
         removed_count = len(deleted_rows)
         
-        # Clean up temporary columns from final output
-        if 'login_uri_normalized' in df_cleaned.columns:
-            df_cleaned = df_cleaned.drop('login_uri_normalized', axis=1)
-        if 'domain' in df_cleaned.columns:
-            df_cleaned = df_cleaned.drop('domain', axis=1)
-        
         print(f"\n{'='*50}")
         print(f"DOMAIN CLEANUP SUMMARY:")
         print(f"{'='*50}")
@@ -1419,17 +2204,147 @@ def automatic_domain_cleanup(csv_file_path, logger=None, dry_run=False):
         print(f"Error processing CSV file: {e}")
         return None, None
 
+def _streaming_shortest_rows(csv_file_path, key_columns, chunk_keys, chunksize=200_000):
+    """First streaming pass: mark the shortest-URI row of each key, ties keeping the earliest.
+    
+    chunk_keys(chunk, uris) returns the grouping key of every row, given the
+    chunk and its normalized login_uri. Only the key columns (plus name) are
+    read, and memory grows with the number of distinct keys, not rows. Returns
+    the keep mask and whether any name needs parenthesized text removed.
+    """
+    has_name = 'name' in read_csv_header(csv_file_path)
+    best = {}
+    total_rows = 0
+    clean_names = False
+    for chunk in _iter_csv_chunks(csv_file_path, chunksize, usecols=key_columns + (['name'] if has_name else [])):
+        uris = strip_trailing_slashes(chunk['login_uri'])
+        for row, (key, uri_len) in enumerate(zip(chunk_keys(chunk, uris), uri_lengths(uris).tolist()), start=total_rows):
+            current = best.get(key)
+            if current is None or uri_len < current[1]:
+                best[key] = (row, uri_len)
+        total_rows += len(chunk)
+        if has_name and not clean_names:
+            clean_names = bool(chunk['name'].str.contains(_PARENS_RE.pattern, na=False).any())
+    
+    keep = np.zeros(total_rows, dtype=bool)
+    keep[[row for row, _ in best.values()]] = True
+    return keep, clean_names
+
+def _stream_split_csv(csv_file_path, keep, output_path, clean_names=False, chunksize=200_000):
+    """Second streaming pass: write kept rows to output_path and the rest to a timestamped deleted-entries CSV.
+    
+    Both files are written under temporary names next to their targets and only
+    moved into place once the whole input has been read, so an output_path
+    naming the input itself cannot truncate it before it is streamed.
+    """
+    base_name, _ = split_extension(csv_file_path)
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    deleted_path = f"{base_name}_deleted_entries_{timestamp}.csv"
+    kept_temp = f"{output_path}.{os.getpid()}.tmp"
+    deleted_temp = f"{deleted_path}.{os.getpid()}.tmp"
+    
+    offset = 0
+    try:
+        with open(kept_temp, 'wb') as kept_file, open(deleted_temp, 'wb') as deleted_file:
+            kept_writer = _CSVChunkWriter(kept_file, read_csv_header(csv_file_path))
+            deleted_writer = _CSVChunkWriter(deleted_file, kept_writer.columns)
+            for chunk in _iter_csv_chunks(csv_file_path, chunksize):
+                if clean_names:
+                    names, _ = strip_parenthesized(chunk['name'])
+                    chunk['name'] = collapse_whitespace(names)
+                chunk_keep = keep[offset:offset + len(chunk)]
+                kept_writer.write(chunk[chunk_keep])
+                deleted_writer.write(chunk[~chunk_keep])
+                offset += len(chunk)
+            kept_writer.close()
+            deleted_writer.close()
+        os.replace(deleted_temp, deleted_path)
+        os.replace(kept_temp, output_path)
+    except BaseException:
+        for temp_path in (kept_temp, deleted_temp):
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+        raise
+    
+    print(f"Deleted entries saved to: {deleted_path}")
+    return deleted_path
+
+def streaming_domain_cleanup(csv_file_path, output_path, logger=None, dry_run=False, chunksize=200_000):
+    """Domain cleanup for exports too large to load, reading the file in chunks.
+    
+    The first pass keeps only the best (row, URI length) per domain + username +
+    password combination; the second streams kept rows to output_path and the
+    deleted rows to a timestamped CSV next to the original file.
+    """
+    key_columns = ['login_uri', 'login_username', 'login_password']
+    columns = read_csv_header(csv_file_path)
+    missing_columns = [col for col in key_columns if col not in columns]
+    if missing_columns:
+        print(f"Error: Missing columns for domain cleanup: {missing_columns}")
+        return None
+    
+    print("\n" + "=" * 60)
+    print("DOMAIN-BASED DUPLICATE CLEANUP (streaming)")
+    print("=" * 60)
+    
+    # First pass: shortest normalized URI per combination; ties keep the earliest row
+    keep, clean_names = _streaming_shortest_rows(
+        csv_file_path, key_columns,
+        lambda chunk, uris: zip(_key_values(extract_domains(uris)),
+                                _key_values(chunk['login_username']),
+                                _key_values(chunk['login_password'])),
+        chunksize)
+    total_rows = len(keep)
+    kept_count = int(keep.sum())
+    
+    total_to_remove = total_rows - kept_count
+    if total_to_remove == 0:
+        print("No duplicate domain + username + password combinations found.")
+        return None
+    
+    action_word = "Would remove" if dry_run else "Will remove"
+    print(f"\nSUMMARY: {action_word} {total_to_remove} entries total, keeping shortest URI for each domain + username + password combination.")
+    print_lines(_DOMAIN_CLEANUP_WARNING)
+    if dry_run:
+        print(f"\n🔍 DRY RUN COMPLETE: Would delete {total_to_remove} entries and keep {kept_count} entries.")
+        print("No changes were made to your data.")
+        return None
+    
+    print(f"\n{'='*60}")
+    print("PROCEED WITH DELETION?")
+    print(f"{'='*60}")
+    print(f"This will delete {total_to_remove} entries and keep {kept_count} entries.")
+    confirmation = input("Type 'DELETE' to confirm, or 'n' to cancel: ").strip()
+    if confirmation.upper() != 'DELETE':
+        print("Domain cleanup cancelled by user.")
+        return None
+    
+    # Second pass: stream every chunk straight into the kept and deleted files
+    deleted_path = _stream_split_csv(csv_file_path, keep, output_path, clean_names, chunksize)
+    
+    print(f"\n{'='*50}")
+    print("DOMAIN CLEANUP SUMMARY:")
+    print(f"{'='*50}")
+    print(f"Original rows: {total_rows}")
+    print(f"Rows removed (same domain + username + password, kept shortest URI): {total_to_remove}")
+    print(f"Remaining rows: {total_rows - total_to_remove}")
+    if logger:
+        logger.info(f"Cleaned data saved to: {output_path}")
+    print(f"\nCleaned CSV saved as: {output_path}")
+    return output_path, deleted_path
+
 def save_cleaned_csv(df, original_path, logger=None):
     if df is None:
         print("No data to save.")
         return
     
-    base_name = original_path.rsplit('.', 1)[0]
-    extension = original_path.rsplit('.', 1)[1] if '.' in original_path else 'csv'
+    base_name, extension = split_extension(original_path)
     new_path = f"{base_name}_cleaned.{extension}"
     
     try:
-        df.to_csv(new_path, index=False)
+        write_csv(df, new_path)
         message = f"Cleaned CSV saved as: {new_path}"
         if logger:
             logger.info(message)
@@ -1442,6 +2357,92 @@ def save_cleaned_csv(df, original_path, logger=None):
         print(f"Error: {error_msg}")
         return None
 
+def save_results(cleaned_df, deleted_df, csv_file, config, logger):
+    """Write the deleted entries and the cleaned data for a finished cleaning run."""
+    if deleted_df is not None and not deleted_df.empty:
+        save_deleted_entries(deleted_df, csv_file, config['deleted_format'])
+    
+    if config['output']:
+        output_path = write_output(cleaned_df, config['output'])
+        logger.info(f"Cleaned data saved to: {output_path}")
+        print(f"\nCleaned data saved as: {output_path}")
+    else:
+        output_path = save_cleaned_csv(cleaned_df, csv_file, logger)
+        if output_path:
+            logger.info(f"Cleaned data saved to: {output_path}")
+
+def run_in_background(func, *args, logger=None):
+    """Run func(*args) in a forked child process and return its pid, or None if it ran nowhere.
+    
+    The child shares the parent's memory copy-on-write, so large frames are not
+    copied or pickled. Without os.fork (Windows), or while other threads are
+    running, nothing runs and the caller should call func itself.
+    """
+    if not hasattr(os, 'fork'):
+        return None
+    # A thread holding a lock at fork time would leave the child deadlocked
+    if sys.modules.get('threading') and sys.modules['threading'].active_count() > 1:
+        return None
+    # Anything still buffered would otherwise be printed by both processes
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        pid = os.fork()
+    except OSError as e:
+        if logger:
+            logger.warning(f"Could not start background process: {e}")
+        return None
+    if pid:
+        return pid
+    
+    status = 1
+    try:
+        func(*args)
+        status = 0
+    except Exception as e:
+        if logger:
+            logger.error(f"Background save failed: {e}")
+        print(f"❌ Background save failed: {e}", file=sys.stderr)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Leave without running the parent's cleanup a second time
+        os._exit(status)
+
+def wait_for_background(pid, timeout=1.0, interval=0.05):
+    """Wait up to timeout seconds for a run_in_background() child.
+    
+    Returns its exit status, or None if it is still running. Failures such as an
+    unwritable output directory show up within the timeout, so the parent can
+    still report them and exit non-zero.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        finished, status = os.waitpid(pid, os.WNOHANG)
+        if finished:
+            return os.waitstatus_to_exitcode(status)
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(interval)
+
+# Accepted values of the enumerated settings, shared by the parser and config files
+SETTING_CHOICES = {
+    'mode': ('interactive', 'auto', 'analyze'),
+    'deleted_format': ('csv', 'parquet'),
+    'engine': ('pandas', 'polars'),
+}
+
+# Config files searched after an explicit --config path, in order
+_LOCAL_CONFIG_FILES = (
+    './clean_pass_config.json',  # Current directory
+    './.clean_pass.json'  # Alternative name
+)
+
+@functools.lru_cache(maxsize=None)
+def home_config_path():
+    """Return the per-user config file path, expanding ~ only once."""
+    return os.path.expanduser('~/.clean_pass_config.json')
+
 def load_config(config_path=None):
     """Load configuration from file."""
     default_config = {
@@ -1449,36 +2450,59 @@ def load_config(config_path=None):
         'verbose': False,
         'dry_run': False,
         'output': None,
-        'show_passwords': False
+        'show_passwords': False,
+        'deleted_format': 'csv',
+        'engine': 'pandas',
+        'prefetch': True
     }
     
-    # Try to find config file
-    config_locations = [
-        config_path,  # User specified
-        os.path.expanduser('~/.clean_pass_config.json'),  # Home directory
-        './clean_pass_config.json',  # Current directory
-        './.clean_pass.json'  # Alternative name
-    ]
+    # Try to find config file: user specified, home directory, then local names
+    config_locations = (config_path, home_config_path()) + _LOCAL_CONFIG_FILES
     
-    for config_file in config_locations:
-        if config_file and Path(config_file).exists():
-            try:
-                with open(config_file, 'r') as f:
-                    user_config = json.load(f)
-                    # Merge user config with defaults
-                    config = {**default_config, **user_config}
-                    print(f"📄 Loaded configuration from: {config_file}")
-                    return config, config_file
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"⚠️  Warning: Could not load config file {config_file}: {e}")
-                continue
+    for config_file in filter(None, config_locations):
+        try:
+            # One stat both finds the file and keys the parse cache
+            stat = os.stat(config_file)
+        except OSError:
+            continue
+        try:
+            user_config = _read_config_cached(os.path.abspath(config_file), stat.st_mtime_ns, stat.st_size)
+            # Merge user config with defaults; the merge is a new dict, so callers
+            # can override settings without touching the cached parse
+            config = default_config.copy()
+            config.update(user_config)
+            print(f"📄 Loaded configuration from: {config_file}")
+            # A misspelled value would otherwise make no mode run at all
+            for key, allowed in SETTING_CHOICES.items():
+                if config[key] not in allowed:
+                    print(f"⚠️  Warning: Ignoring {key} {config[key]!r} in {config_file} "
+                          f"(choose from {', '.join(allowed)})")
+                    config[key] = default_config[key]
+            return config, config_file
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"⚠️  Warning: Could not load config file {config_file}: {e}")
+            continue
     
     return default_config, None
 
+@functools.lru_cache(maxsize=4)
+def _read_config_cached(config_file, mtime_ns, size):
+    """Parse a JSON config file; mtime_ns and size are only part of the cache key."""
+    with open(config_file, 'rb') as f:
+        data = f.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _json_dumps(obj):
+    """Serialize obj as JSON indented by two spaces, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 def save_config_template(config_path=None):
     """Save a configuration template file."""
     if not config_path:
-        config_path = os.path.expanduser('~/.clean_pass_config.json')
+        config_path = home_config_path()
     
     template_config = {
         "_comment": "Configuration file for clean_pass.py - remove this comment line before use",
@@ -1487,18 +2511,34 @@ def save_config_template(config_path=None):
         "dry_run": False,
         "output": None,
         "show_passwords": False,
+        "deleted_format": "csv",
+        "engine": "pandas",
+        "prefetch": True,
         "_settings_info": {
             "mode": "Options: analyze, interactive, auto",
             "verbose": "Boolean: true for detailed logging",
             "dry_run": "Boolean: true to preview changes without modifying files",
             "output": "String: custom output file path (null for auto-generated)",
-            "show_passwords": "Boolean: true to show passwords in interactive mode (use with caution)"
+            "show_passwords": "Boolean: true to show passwords in interactive mode (use with caution)",
+            "deleted_format": "Options: csv, parquet (parquet needs pyarrow; smaller and faster to write)",
+            "engine": "Options: pandas, polars (auto mode only; polars runs domain cleanup as one lazy query)",
+            "prefetch": "Boolean: false to skip preparing the cleaned data while the deletion prompt waits (saves memory)"
         }
     }
     
+    content = _json_dumps(template_config)
+    try:
+        # Rewriting a file that already holds this exact template changes nothing
+        with open(config_path, 'r') as f:
+            if f.read() == content:
+                print(f"✅ Configuration template already up to date: {config_path}")
+                return config_path
+    except (OSError, UnicodeDecodeError):
+        pass
+    
     try:
         with open(config_path, 'w') as f:
-            json.dump(template_config, f, indent=2)
+            f.write(content)
         print(f"✅ Configuration template saved to: {config_path}")
         print("Edit this file to set your default preferences.")
         return config_path
@@ -1506,32 +2546,45 @@ def save_config_template(config_path=None):
         print(f"❌ Error saving config template: {e}")
         return None
 
-def parse_arguments():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Clean and deduplicate Bitwarden CSV exports",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_HELP_EPILOG = """
 Examples:
   %(prog)s -f export.csv --mode interactive --verbose
   %(prog)s -f export.csv --mode interactive --show-passwords
   %(prog)s -f export.csv --mode auto --dry-run
+  %(prog)s -f export.csv --mode auto --engine polars
   %(prog)s -f export.csv --mode analyze
   %(prog)s --save-config  # Create configuration template
   %(prog)s --list-backups export.csv  # Show available backups
   %(prog)s --undo export.csv  # Restore from backups
 """
-    )
+
+@functools.lru_cache(maxsize=None)
+def _help_parser_class():
+    """Return an ArgumentParser subclass that formats the examples epilog only when --help is shown.
+    
+    The class is built on first use so that argparse is only imported once
+    there are arguments to parse.
+    """
+    class HelpParser(argparse.ArgumentParser):
+        def format_help(self):
+            self.epilog = _HELP_EPILOG
+            self.formatter_class = argparse.RawDescriptionHelpFormatter
+            return super().format_help()
+    
+    return HelpParser
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = _help_parser_class()(description="Clean and deduplicate Bitwarden CSV exports")
     
     parser.add_argument(
         '-f', '--file',
-        required=True,
-        help='Path to the Bitwarden CSV export file'
+        help='Path to the Bitwarden CSV export file (required unless saving a config or managing backups)'
     )
     
     parser.add_argument(
         '--mode',
-        choices=['interactive', 'auto', 'analyze'],
+        choices=SETTING_CHOICES['mode'],
         default='analyze',
         help='Cleaning mode (default: analyze)'
     )
@@ -1550,7 +2603,7 @@ Examples:
     
     parser.add_argument(
         '--output',
-        help='Output file path (default: auto-generated)'
+        help='Output file path (default: auto-generated CSV; .parquet or .feather writes that format, requires pyarrow)'
     )
     
     parser.add_argument(
@@ -1580,10 +2633,72 @@ Examples:
         help='Show passwords in interactive mode (use with caution)'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--deleted-format',
+        choices=SETTING_CHOICES['deleted_format'],
+        help='File format for the deleted entries backup (default: csv)'
+    )
+    
+    parser.add_argument(
+        '--engine',
+        choices=SETTING_CHOICES['engine'],
+        help='DataFrame engine for auto mode domain cleanup (default: pandas)'
+    )
+    
+    parser.add_argument(
+        '--no-prefetch',
+        action='store_true',
+        help="Don't prepare the cleaned data in the background while waiting for confirmation (lower peak memory)"
+    )
+    
+    parser.add_argument(
+        '--background',
+        action='store_true',
+        help='Write the output files from a background process so the shell returns sooner (Linux/macOS)'
+    )
+    
+    args = parser.parse_args()
+    # --file is only needed for cleaning; checking here reports it with the usual
+    # usage message before any config file is read
+    if not (args.file or args.save_config or args.list_backups or args.undo):
+        parser.error("the following arguments are required: -f/--file")
+    return args
+
+# (argument, parser default) pairs for options that override the config setting
+# of the same name whenever they were given on the command line
+_CLI_OVERRIDES = (
+    ('mode', 'analyze'),
+    ('verbose', False),
+    ('dry_run', False),
+    ('output', None),
+    ('show_passwords', False),
+    ('deleted_format', None),
+    ('engine', None),
+)
+
+def apply_cli_overrides(config, args):
+    """Apply explicitly given command line options on top of config, in place, and return it."""
+    options = vars(args)
+    for key, default in _CLI_OVERRIDES:
+        value = options.get(key, default)
+        # Empty and default values mean the option was not given
+        if value and value != default:
+            config[key] = value
+    if options.get('no_prefetch'):
+        config['prefetch'] = False
+    return config
 
 def main():
     """Main entry point for the script."""
+    if len(sys.argv) == 1:
+        # Nothing to do without arguments; report the usage error parse_arguments()
+        # would, without importing argparse and building the parser
+        prog = os.path.basename(sys.argv[0])
+        sys.stderr.write(f"usage: {prog} -f FILE [--mode {{{','.join(SETTING_CHOICES['mode'])}}}] [options]\n"
+                         f"{prog}: error: the following arguments are required: -f/--file "
+                         f"(see {prog} --help)\n")
+        sys.exit(2)
+    
     args = parse_arguments()
     
     # Handle config template creation
@@ -1610,21 +2725,7 @@ def main():
     config, config_file = load_config(args.config)
     
     # Command line arguments override config file settings
-    if hasattr(args, 'mode') and args.mode != 'analyze':  # Only override if explicitly set
-        config['mode'] = args.mode
-    if args.verbose:
-        config['verbose'] = True
-    if args.dry_run:
-        config['dry_run'] = True
-    if args.output:
-        config['output'] = args.output
-    if args.show_passwords:
-        config['show_passwords'] = True
-    
-    # Ensure file argument is always from command line
-    if not hasattr(args, 'file') or not args.file:
-        print("❌ Error: --file argument is required")
-        sys.exit(1)
+    apply_cli_overrides(config, args)
     
     logger = setup_logging(config['verbose'])
     
@@ -1639,7 +2740,20 @@ def main():
         
         # Comprehensive CSV validation
         try:
-            validate_csv_file(csv_file, logger)
+            BitwandenCSVValidator.validate_file_exists(csv_file)
+            # Very large exports in automatic mode are never loaded whole; every
+            # stage below reads them in chunks instead
+            large_auto = config['mode'] == 'auto' and get_file_size_mb(csv_file) > 500
+            streaming = large_auto and config['engine'] == 'pandas'
+            # The polars engine scans a large export lazily itself, so loading it
+            # here as well would hold it in memory twice
+            if streaming or (large_auto and POLARS_AVAILABLE):
+                df = None
+                validate_csv_file(csv_file, logger)
+            else:
+                # Parse the CSV a single time; validation and every stage below share it
+                df = load_csv(csv_file)
+                validate_csv_file(csv_file, logger, df=df)
             print("✓ CSV validation passed")
         except (FileNotFoundError, ValueError, CSVValidationError) as e:
             logger.error(f"CSV validation failed: {e}")
@@ -1652,36 +2766,28 @@ def main():
         
         print("\nCSV Columns:")
         print("-" * 40)
-        columns = read_csv_and_print_columns(csv_file, logger)
+        columns = read_csv_and_print_columns(csv_file, logger, df=df)
         
         if columns is None:
             logger.error("Failed to read CSV file")
             sys.exit(1)
         
-        # Create backup before any modifications (skip for analyze mode)
-        if config['mode'] != 'analyze':
-            print("\n💾 Creating backup of original file...")
-            backup_path = create_backup(csv_file, logger)
-            if not backup_path:
-                print("❌ Failed to create backup. Aborting for safety.")
-                sys.exit(1)
-        
         # Analysis phase
         print("\n" + "=" * 50)
         print("Checking for duplicate login_uri entries:")
         print("=" * 50)
-        duplicate_list = find_duplicate_login_uris(csv_file, logger)
+        duplicate_list = find_duplicate_login_uris(csv_file, logger, df=df)
         
-        if duplicate_list:
+        if len(duplicate_list):
             logger.info(f"Found {len(duplicate_list)} duplicate URI entries")
-            print(f"\nReturned {len(duplicate_list)} duplicate rows as a list for further filtering.")
+            print(f"\nReturned {len(duplicate_list)} duplicate rows for further filtering.")
         
         print("\n" + "=" * 70)
         print("Checking for duplicate login_uri AND login_username combinations:")
         print("=" * 70)
-        duplicate_uri_username_list = find_duplicate_uri_and_username(csv_file, logger)
+        duplicate_uri_username_list = find_duplicate_uri_and_username(csv_file, logger, df=df)
         
-        if duplicate_uri_username_list:
+        if len(duplicate_uri_username_list):
             logger.info(f"Found {len(duplicate_uri_username_list)} duplicate URI+username entries")
             print(f"\nReturned {len(duplicate_uri_username_list)} rows with duplicate URI and username for further filtering.")
         
@@ -1690,41 +2796,76 @@ def main():
             print("\nAnalysis complete. Use --mode to specify cleaning operation.")
             return
         
-        if not duplicate_list:
+        if not len(duplicate_list):
             print("No duplicates found - nothing to clean.")
             return
         
+        if config['mode'] == 'interactive' and config['dry_run']:
+            print("DRY RUN MODE: Cannot use dry-run with interactive mode")
+            return
+        
+        # Create backup before any modifications; only reached when there are
+        # duplicates to clean, and a dry run never modifies anything
+        if not config['dry_run']:
+            print("\n💾 Creating backup of original file...")
+            backup_path = create_backup(csv_file, logger)
+            if not backup_path:
+                print("❌ Failed to create backup. Aborting for safety.")
+                sys.exit(1)
+        
         # Cleaning operations
         cleaned_df = None
         deleted_df = None
         
         if config['mode'] == 'interactive':
-            if config['dry_run']:
-                print("DRY RUN MODE: Cannot use dry-run with interactive mode")
-                return
             print("\nStarting interactive deletion...")
-            cleaned_df = interactive_delete_duplicates(csv_file, logger, config['show_passwords'])
+            cleaned_df = interactive_delete_duplicates(csv_file, logger, config['show_passwords'], df=df,
+                                                       deleted_format=config['deleted_format'])
+        
+        elif config['mode'] == 'auto' and streaming:
+            print("\nStarting automatic domain-based cleanup...")
+            # Same default name as save_cleaned_csv(), keeping the input's extension
+            base_name, extension = split_extension(csv_file)
+            output_path = config['output'] or f"{base_name}_cleaned.{extension}"
+            output_root, output_extension = split_extension(output_path)
+            if output_extension.lower() in _COLUMNAR_EXTENSIONS:
+                # Streamed output is appended chunk by chunk, which only the CSV writer does
+                output_path = f"{output_root}.csv"
+                print(f"⚠️  Streamed output is always CSV; saving to {output_path}")
+            streaming_domain_cleanup(csv_file, output_path, logger, config['dry_run'])
+            if config['dry_run']:
+                print("🔍 DRY RUN: No files were saved.")
+            return
         
         elif config['mode'] == 'auto':
             print("\nStarting automatic domain-based cleanup...")
-            result = automatic_domain_cleanup(csv_file, logger, config['dry_run'])
+            result = automatic_domain_cleanup(csv_file, logger, config['dry_run'], df=df, engine=config['engine'],
+                                              prefetch=config['prefetch'])
             if result and len(result) == 2:
                 cleaned_df, deleted_df = result
         
+        # The cleaned and deleted frames are copies, so the loaded frame can be
+        # released before the outputs are written; load_csv()'s cache holds it too
+        df = None
+        _parse_csv_cached.cache_clear()
+        
         # Save results (skip in dry run mode)
         if cleaned_df is not None and not config['dry_run']:
-            if deleted_df is not None and not deleted_df.empty:
-                save_deleted_entries(deleted_df, csv_file)
-            
-            if config['output']:
-                output_path = config['output']
-                cleaned_df.to_csv(output_path, index=False)
-                logger.info(f"Cleaned data saved to: {output_path}")
-                print(f"\nCleaned CSV saved as: {output_path}")
+            pid = None
+            # Only on request: scripts expect the files to exist once we exit
+            if args.background:
+                pid = run_in_background(save_results, cleaned_df, deleted_df, csv_file, config, logger,
+                                        logger=logger)
+            if pid:
+                logger.info(f"Saving results in background process {pid}")
+                status = wait_for_background(pid)
+                if status:
+                    print(f"❌ Background save failed (exit status {status})")
+                    sys.exit(1)
+                if status is None:
+                    print(f"\n💾 Still saving in background (pid={pid})")
             else:
-                output_path = save_cleaned_csv(cleaned_df, csv_file, logger)
-                if output_path:
-                    logger.info(f"Cleaned data saved to: {output_path}")
+                save_results(cleaned_df, deleted_df, csv_file, config, logger)
         elif config['dry_run']:
             print("🔍 DRY RUN: No files were saved.")
         
@@ -0,0 +1,33 @@
+import os
+import tempfile
+import unittest
+
+import clean_pass
+
+try:
+    import pandas  # noqa: F401
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+
+@unittest.skipUnless(PANDAS_AVAILABLE, "pandas is not installed")
+class LoadCSVTest(unittest.TestCase):
+    def test_quoted_newline_in_notes(self):
+        content = (
+            'folder,favorite,type,name,notes,fields,reprompt,login_uri,login_username,login_password,login_totp\n'
+            ',,login,Example,"first line\nsecond line",,0,https://example.com,alice,secret,\n'
+            ',,login,Other,,,0,https://other.com,bob,hunter2,\n'
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'export.csv')
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+            df = clean_pass.load_csv(path)
+        self.assertEqual(len(df), 2)
+        self.assertEqual(df['notes'].iloc[0], 'first line\nsecond line')
+        self.assertEqual(df['login_username'].iloc[1], 'bob')
+
+
+if __name__ == '__main__':
+    unittest.main()